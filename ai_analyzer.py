@@ -8,6 +8,7 @@ from datetime import datetime
 import re
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import logging
 
 # ==================== CONFIGURAÇÃO DE LOGGING ====================
@@ -81,6 +82,13 @@ class Skill:
 
 
 # ==================== CONFIGURAÇÃO ====================
+@lru_cache(maxsize=1)
+def _load_env_file() -> bool:
+    """Lê o .env uma única vez por processo (load_dotenv não sobrescreve o ambiente)"""
+    from dotenv import load_dotenv
+    return load_dotenv()
+
+
 class Config:
     """Gerenciador de configurações"""
     
@@ -95,8 +103,7 @@ class Config:
     def _load_env(self):
         """Carrega variáveis de ambiente"""
         try:
-            from dotenv import load_dotenv
-            load_dotenv()
+            _load_env_file()
             logger.info(" Variáveis de ambiente carregadas")
         except ImportError:
             logger.warning("⚠️ python-dotenv não instalado")
@@ -584,17 +591,21 @@ IMPORTANTE: Retorne APENAS o JSON, sem texto adicional.
 class EnhancedLocalAnalyzer:
     """Analisador local (fallback)"""
     
+    def __init__(self):
+        # Instância única, para reaproveitar os caches do EnhancedCVAnalyzer
+        self._analyzer = None
+    
     def analyze(self, candidate_data: Dict[str, Any],
                 job_requirements: Dict[str, Any]) -> Dict[str, Any]:
         """Executa análise local"""
         logger.info(" Usando Enhanced Local Analyzer...")
         
         try:
-            from enhanced_analyzer import EnhancedCVAnalyzer
-            
-            analyzer = EnhancedCVAnalyzer()
+            if self._analyzer is None:
+                from enhanced_analyzer import EnhancedCVAnalyzer
+                self._analyzer = EnhancedCVAnalyzer()
             
-            result = analyzer.analyze(
+            result = self._analyzer.analyze(
                 cv_text=candidate_data.get('resume_text', ''),
                 job_description=f"{job_requirements.get('description', '')} {job_requirements.get('requirements', '')}",
                 candidate_name=candidate_data.get('name', 'Candidato')
@@ -2,7 +2,6 @@ import os
 from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
-from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
 from datetime import datetime, timedelta
 from flask_migrate import Migrate
@@ -12,6 +11,9 @@ import json
 from urllib.parse import quote
 from sqlalchemy import text
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import atexit
 import re
 import sys
 import io
@@ -21,12 +23,16 @@ from utils.validators import (
     allowed_file,
     validate_email,
     validate_phone,
+    phone_digits,
     sanitize_filename,
     validate_file_size,
-    validate_pdf_content,
+    validate_file_size_path,
+    validate_pdf_content_timeout,
+    in_pdf_validation_child,
     validate_username,
     validate_password
 )
+from utils.security import hash_password, verify_password
 
 # ==================== CONFIGURAÇÃO ====================
 app = Flask(__name__)
@@ -67,10 +73,33 @@ app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
 # Criar pasta de uploads
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
-# Logging
-logging.basicConfig(level=logging.INFO)
+# Logging - handlers rodam em thread separada (QueueListener) para não bloquear o request
+# LOG_LEVEL=WARNING em produção reduz o volume de logs
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_queue_handler = QueueHandler(queue.SimpleQueue())
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper(), handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
+
+def _start_log_listener():
+    """Inicia o listener de logs (também após fork dos workers do gunicorn)"""
+    global log_listener
+    _queue_handler.queue = queue.SimpleQueue()
+    log_listener = QueueListener(_queue_handler.queue, _log_handler)
+    log_listener.start()
+
+
+def _after_fork_in_child():
+    """Workers do gunicorn ganham um listener novo; filhos de validação de PDF não precisam"""
+    if not in_pdf_validation_child():
+        _start_log_listener()
+
+
+_start_log_listener()
+os.register_at_fork(after_in_child=_after_fork_in_child)
+atexit.register(lambda: log_listener.stop())
+
 db = SQLAlchemy(app)
 migrate = Migrate(app, db)
 login_manager = LoginManager()
@@ -94,7 +123,7 @@ def whatsapp_link(phone):
     if not phone:
         return '#'
     
-    clean_phone = ''.join(filter(str.isdigit, str(phone)))
+    clean_phone = phone_digits(phone)
     
     if len(clean_phone) <= 11 and not clean_phone.startswith('55'):
         clean_phone = '55' + clean_phone
@@ -111,9 +140,17 @@ class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False, index=True)
     email = db.Column(db.String(120), unique=True, nullable=False, index=True)
-    password_hash = db.Column(db.String(200))
+    password_hash = db.Column(db.String(256))
     is_admin = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def set_password(self, password):
+        """Gera o hash da senha com o método fixado em utils.security"""
+        self.password_hash = hash_password(password)
+    
+    def check_password(self, password):
+        """Verifica a senha contra o hash armazenado"""
+        return verify_password(self.password_hash, password)
 
 class Job(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -137,6 +174,12 @@ class Candidate(db.Model):
     status = db.Column(db.String(20), default='pending')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     resume_text = db.Column(db.Text)
+    
+    # Ranking por vaga e filtros por status sem varrer a tabela
+    __table_args__ = (
+        db.Index('ix_candidate_job_score', 'job_id', db.desc('ai_score')),
+        db.Index('ix_candidate_status', 'status'),
+    )
 
 class Interview(db.Model):
     """Model para entrevistas agendadas"""
@@ -570,7 +613,7 @@ def login():
             (User.username == username) | (User.email == username)
         ).first()
         
-        if user and check_password_hash(user.password_hash, password):
+        if user and user.check_password(password):
             login_user(user)
             flash(f'[OK] Bem-vindo, {user.username}!', 'success')
             next_page = request.args.get('next')
@@ -628,9 +671,9 @@ def register():
         user = User(
             username=username,
             email=email,
-            password_hash=generate_password_hash(password),
             is_admin=is_first_user
         )
+        user.set_password(password)
         
         try:
             db.session.add(user)
@@ -671,7 +714,7 @@ def change_password():
             flash('[ERROR] Preencha todos os campos!', 'danger')
             return render_template('change_password.html')
         
-        if not check_password_hash(current_user.password_hash, current_password):
+        if not current_user.check_password(current_password):
             flash('[ERROR] Senha atual incorreta!', 'danger')
             return render_template('change_password.html')
         
@@ -685,7 +728,7 @@ def change_password():
             return render_template('change_password.html')
         
         try:
-            current_user.password_hash = generate_password_hash(new_password)
+            current_user.set_password(new_password)
             db.session.commit()
             
             flash('[OK] Senha alterada com sucesso!', 'success')
@@ -742,8 +785,8 @@ def dashboard():
     total_candidates = Candidate.query.count()
     pending_candidates = Candidate.query.filter_by(status='pending').count()
     
-    candidates_with_score = Candidate.query.filter(Candidate.ai_score.isnot(None)).all()
-    avg_score = sum(c.ai_score for c in candidates_with_score) / len(candidates_with_score) if candidates_with_score else 0.0
+    # Média calculada no banco (AVG), sem carregar os candidatos
+    avg_score = db.session.query(db.func.avg(Candidate.ai_score)).scalar() or 0.0
     
     # Total de entrevistas
     total_interviews = Interview.query.count()
@@ -877,6 +920,9 @@ def reanalyze_all_candidates_for_job(job_id):
         'requirements': job.requirements or ''
     }
 
+    # Resultados acumulados e gravados de uma vez no final (um UPDATE em lote)
+    updates = []
+
     for candidate in candidates:
         if not candidate.resume_text:
             error_count += 1
@@ -893,8 +939,11 @@ def reanalyze_all_candidates_for_job(job_id):
             new_analysis = ai_analyzer.analyze_candidate(candidate_data, job_requirements)
 
             if 'overall_score' in new_analysis:
-                candidate.ai_score = new_analysis['overall_score']
-                candidate.ai_analysis = json.dumps(new_analysis)
+                updates.append({
+                    'id': candidate.id,
+                    'ai_score': new_analysis['overall_score'],
+                    'ai_analysis': json.dumps(new_analysis)
+                })
                 success_count += 1
             else:
                 error_count += 1
@@ -905,6 +954,8 @@ def reanalyze_all_candidates_for_job(job_id):
             logger.error(f"[ERROR] Erro ao reanalisar candidato {candidate.id}: {e}")
 
     try:
+        if updates:
+            db.session.bulk_update_mappings(Candidate, updates)
         db.session.commit()
         flash(f'[OK] Reanálise concluída! {success_count} candidatos atualizados.', 'success')
         if error_count > 0:
@@ -971,7 +1022,7 @@ def new_candidate(job_id):
         file.save(filepath)
         logger.info(f" Arquivo salvo: {filepath}")
         
-        valid_pdf, pdf_error = validate_pdf_content(filepath)
+        valid_pdf, pdf_error = validate_pdf_content_timeout(filepath)
         if not valid_pdf:
             safe_delete_file(filepath)
             flash(f'[ERROR] PDF inválido: {pdf_error}', 'danger')
@@ -1396,14 +1447,14 @@ def bulk_upload_candidates(job_id):
                 file.save(filepath)
                 logger.info(f" Arquivo salvo: {filepath}")
                 
-                valid_size, size_error = validate_file_size(file, max_size_mb=16)
+                valid_size, size_error = validate_file_size_path(filepath, max_size_mb=16)
                 if not valid_size:
                     safe_delete_file(filepath)
                     error_count += 1
                     errors.append(f'{filename}: {size_error}')
                     continue
                 
-                valid_pdf, pdf_error = validate_pdf_content(filepath)
+                valid_pdf, pdf_error = validate_pdf_content_timeout(filepath)
                 if not valid_pdf:
                     safe_delete_file(filepath)
                     error_count += 1
@@ -1655,8 +1706,7 @@ def metrics():
     """Página de métricas"""
     total_candidates = Candidate.query.count()
     
-    candidates_with_score = Candidate.query.filter(Candidate.ai_score.isnot(None)).all()
-    avg_score = sum(c.ai_score for c in candidates_with_score) / len(candidates_with_score) if candidates_with_score else 0
+    avg_score = db.session.query(db.func.avg(Candidate.ai_score)).scalar() or 0
     
     total_interviews = Interview.query.count()
     
@@ -5,18 +5,48 @@ Sistema de análise profunda com cálculos automáticos e respostas contextuais
 
 import os
 import re
+import logging
 import requests
 import certifi
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional
 
+logger = logging.getLogger(__name__)
 
+# Padrões de propaganda comercial, aplicados em sequência (a remoção de um
+# pode expor ou desfazer o match do seguinte)
+_PROPAGANDA_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    r'🚀.*?construir um time.*?\n',
+    r'Vamos juntos.*?\n',
+    r'Se você conhece alguém.*?\n',
+    r'#\w+\s*',
+    r'Na TalentScope.*?\n',
+    r'Descubra.*?potencial.*?\n',
+    r'Entre em contato.*?\n',
+    r'revolucionando.*?\n'
+))
+
+# Todos os padrões numa alternação, só para a checagem rápida: sem nenhum match
+# no texto original, nenhuma das passadas muda nada
+_PROPAGANDA_RE = re.compile(
+    '|'.join(pattern.pattern for pattern in _PROPAGANDA_PATTERNS), re.IGNORECASE | re.DOTALL
+)
+
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+
+# Acima deste número de candidatos a formatação é dividida em lotes numa thread pool
+_PARALLEL_FORMAT_THRESHOLD = 200
+_FORMAT_CHUNK_SIZE = 50
+
+
+@dataclass(slots=True)
 class TessResponse:
     """Classe de resposta compatível com app.py"""
-    def __init__(self, success, content, metadata=None, error=None):
-        self.success = success
-        self.content = content
-        self.metadata = metadata or {}
-        self.error = error
+    success: bool
+    content: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
 
 
 class TessChatbotService:
@@ -33,7 +63,7 @@ class TessChatbotService:
         self.session = requests.Session()
         self.session.verify = certifi.where()
         
-        print(f"🤖 Chatbot Inteligente inicializado - Agent ID: {self.agent_id}")
+        logger.info("Chatbot Inteligente inicializado - Agent ID: %s", self.agent_id)
     
     def process_query(self, candidates, jobs, user_query, **kwargs):
         """
@@ -59,9 +89,7 @@ class TessChatbotService:
             )
             
         except Exception as e:
-            print(f"❌ Erro no process_query: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Erro no process_query: %s", e)
             return TessResponse(
                 success=False,
                 content=f"❌ Erro ao processar: {str(e)}",
@@ -175,38 +203,59 @@ class TessChatbotService:
     
     def _format_candidates_detailed(self, candidates, jobs):
         """Formata candidatos com análise detalhada"""
-        formatted = []
+        # Índices por título da vaga (primeira vaga com o título vence)
+        jobs_by_title = {}
+        for j in jobs:
+            jobs_by_title.setdefault(j.get('titulo'), j)
+        
+        req_skills_by_title = {}
+        for title, j in jobs_by_title.items():
+            required_skills = j.get('skills_requeridas', '').lower()
+            if required_skills:
+                req_skills_by_title[title] = [s.strip() for s in required_skills.split(',')]
+        
+        def format_chunk(chunk):
+            return [self._format_one_candidate(c, jobs_by_title, req_skills_by_title) for c in chunk]
+        
+        if len(candidates) > _PARALLEL_FORMAT_THRESHOLD:
+            chunks = [candidates[i:i + _FORMAT_CHUNK_SIZE]
+                      for i in range(0, len(candidates), _FORMAT_CHUNK_SIZE)]
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                formatted = [text for chunk in executor.map(format_chunk, chunks) for text in chunk]
+        else:
+            formatted = format_chunk(candidates)
         
-        for c in candidates:
-            # Calcular score ponderado
-            weighted_score = (c.get('score_hard_skills', 0) * 0.6 + 
-                            c.get('score_soft_skills', 0) * 0.4)
-            
-            # Extrair skills como lista
-            skills_str = c.get('skills_extraidas', '')
-            if skills_str:
-                skills_list = [s.strip() for s in skills_str.split(',')[:5]]
-                skills_formatted = ', '.join(skills_list)
-            else:
-                skills_formatted = 'Não informado'
-            
-            # Análise de gap (comparar com vaga)
-            vaga_aplicada = c.get('vaga_aplicada', '')
-            job_match = next((j for j in jobs if j.get('titulo') == vaga_aplicada), None)
+        return "\n\n".join(formatted)
+    
+    def _format_one_candidate(self, c, jobs_by_title, req_skills_by_title):
+        """Formata um candidato (independente dos demais)"""
+        # Calcular score ponderado
+        weighted_score = (c.get('score_hard_skills', 0) * 0.6 + 
+                        c.get('score_soft_skills', 0) * 0.4)
+        
+        # Extrair skills como lista
+        skills_str = c.get('skills_extraidas', '')
+        if skills_str:
+            skills_list = [s.strip() for s in skills_str.split(',')[:5]]
+            skills_formatted = ', '.join(skills_list)
+        else:
+            skills_formatted = 'Não informado'
+        
+        # Análise de gap (comparar com vaga)
+        vaga_aplicada = c.get('vaga_aplicada', '')
+        
+        gap_analysis = "N/A"
+        if vaga_aplicada in jobs_by_title:
+            req_skills_list = req_skills_by_title.get(vaga_aplicada)
             
-            gap_analysis = "N/A"
-            if job_match:
-                required_skills = job_match.get('skills_requeridas', '').lower()
+            # Calcular match simplificado
+            if req_skills_list:
                 candidate_skills_lower = skills_str.lower()
-                
-                # Calcular match simplificado
-                if required_skills:
-                    req_skills_list = [s.strip() for s in required_skills.split(',')]
-                    matches = sum(1 for rs in req_skills_list if rs in candidate_skills_lower)
-                    match_pct = (matches / len(req_skills_list) * 100) if req_skills_list else 0
-                    gap_analysis = f"{match_pct:.0f}% de match com vaga"
-            
-            formatted_text = f"""**{c.get('name', 'N/A')}** (ID: {c.get('id')})
+                matches = sum(1 for rs in req_skills_list if rs in candidate_skills_lower)
+                match_pct = matches / len(req_skills_list) * 100
+                gap_analysis = f"{match_pct:.0f}% de match com vaga"
+        
+        return f"""**{c.get('name', 'N/A')}** (ID: {c.get('id')})
 - Vaga Aplicada: {vaga_aplicada}
 - Senioridade: {c.get('senioridade', 'N/A')}
 - Score Geral: {c.get('score_geral', 0)}/10 | Score Ponderado: {weighted_score:.1f}/10
@@ -216,10 +265,6 @@ class TessChatbotService:
 - Recomendação: {c.get('recomendacao', 'N/A')}
 - Pontos Fortes: {c.get('pontos_fortes', 'N/A')[:100]}...
 - Pontos de Atenção: {c.get('pontos_atencao', 'N/A')[:100]}..."""
-            
-            formatted.append(formatted_text)
-        
-        return "\n\n".join(formatted)
     
     def _format_jobs_detailed(self, jobs, candidates):
         """Formata vagas com análise de demanda"""
@@ -380,7 +425,7 @@ Analise profundamente os dados fornecidos e responda com:
         }
         
         try:
-            print(f"🔄 Chamando Tess Agent {self.agent_id}...")
+            logger.info("Chamando Tess Agent %s...", self.agent_id)
             
             response = self.session.post(
                 self.tess_endpoint,
@@ -389,15 +434,14 @@ Analise profundamente os dados fornecidos e responda com:
                 timeout=60
             )
             
-            print(f"📡 Status HTTP: {response.status_code}")
+            logger.info("Status HTTP: %s", response.status_code)
             
             if response.status_code != 200:
                 try:
                     error_detail = response.json()
-                    print(f"⚠️ Erro da API: {error_detail}")
                 except:
                     error_detail = response.text[:300]
-                    print(f"⚠️ Erro da API: {error_detail}")
+                logger.warning("Erro da API: %s", error_detail)
                 
                 return f"❌ Erro HTTP {response.status_code}: A API retornou um erro."
             
@@ -410,55 +454,42 @@ Analise profundamente os dados fornecidos e responda com:
             # Pós-processar para remover propaganda
             output = self._clean_propaganda(output)
             
-            print(f"✅ Resposta recebida ({len(output)} caracteres)")
+            logger.info("Resposta recebida (%d caracteres)", len(output))
             return output
             
         except requests.exceptions.Timeout:
             return "⏱️ Timeout. Tente novamente."
         
         except Exception as e:
-            print(f"❌ Erro: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Erro ao chamar Tess: %s", e)
             return f"❌ Erro ao processar: {str(e)}"
     
     def _extract_tess_output(self, response_data):
         """Extrai output da resposta"""
-        try:
-            if isinstance(response_data, dict) and 'responses' in response_data:
-                responses = response_data.get('responses') or []
-                if isinstance(responses, list) and len(responses) > 0:
-                    first = responses[0]
-                    output = first.get('output')
-                    if output:
-                        return str(output)
-        except Exception as e:
-            print(f"⚠️ Erro ao ler output: {e}")
-        
         if isinstance(response_data, dict):
-            for key in ['output', 'result', 'message', 'response']:
-                if key in response_data and response_data[key]:
-                    return str(response_data[key])
+            responses = response_data.get('responses')
+            if responses and isinstance(responses, list):
+                first = responses[0]
+                output = first.get('output') if isinstance(first, dict) else None
+                if output:
+                    return output if isinstance(output, str) else str(output)
+            
+            for key in ('output', 'result', 'message', 'response'):
+                value = response_data.get(key)
+                if value:
+                    return value if isinstance(value, str) else str(value)
         
         return str(response_data)
     
     def _clean_propaganda(self, text):
         """Remove propaganda comercial da resposta"""
-        propaganda_patterns = [
-            r'🚀.*?construir um time.*?\n',
-            r'Vamos juntos.*?\n',
-            r'Se você conhece alguém.*?\n',
-            r'#\w+\s*',
-            r'Na TalentScope.*?\n',
-            r'Descubra.*?potencial.*?\n',
-            r'Entre em contato.*?\n',
-            r'revolucionando.*?\n'
-        ]
-        
         cleaned = text
-        for pattern in propaganda_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE | re.DOTALL)
         
-        cleaned = re.sub(r'\n\s*\n\s*\n+', '\n\n', cleaned)
+        # Caminho rápido: a maioria das respostas não tem propaganda
+        if _PROPAGANDA_RE.search(cleaned) is not None:
+            for pattern in _PROPAGANDA_PATTERNS:
+                cleaned = pattern.sub('', cleaned)
+        
+        cleaned = _BLANK_LINES_RE.sub('\n\n', cleaned)
         
         return cleaned.strip()
\ No newline at end of file
@@ -1,59 +1,67 @@
 import re
+import sys
+import fileinput
 
-def remove_emojis():
-    with open('chatbot_service.py', 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Dicionário de substituições
-    replacements = {
-        '🚀': 'Inicializando',
-        '🤖': 'CONFIGURACAO', 
-        '🔑': 'API Key',
-        '🌐': 'Endpoint',
-        '⏱️': 'Timeout',
-        '🎯': 'Model',
-        '🌡️': 'Temperature',
-        '✅': 'OK',
-        '💬': 'NOVA QUERY',
-        '📝': 'Query',
-        '👥': 'Candidatos',
-        '💼': 'Vagas',
-        '📡': 'Enviando',
-        '👋': 'Processando',
-        '📄': 'Processando',
-        '🔍': 'Testando',
-        '❌': 'ERROR',
-        '⚠️': 'WARN',
-        '🔥': 'Pontos Fortes',
-        '💡': 'Recomendacao',
-        '❓': 'PERGUNTA',
-    }
-    
-    # Remover todos os emojis
-    for emoji, replacement in replacements.items():
-        content = content.replace(emoji, replacement)
-    
-    # Remover outros emojis não listados
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # símbolos & pictogramas
-        "\U0001F680-\U0001F6FF"  # transporte & símbolos
-        "\U0001F700-\U0001F77F"  # alquimia
-        "\U0001F780-\U0001F7FF"  # formas geométricas
-        "\U0001F800-\U0001F8FF"  # setas suplementares
-        "\U0001F900-\U0001F9FF"  # símbolos suplementares
-        "\U0001FA00-\U0001FA6F"  # símbolos de xadrez
-        "\U0001FA70-\U0001FAFF"  # símbolos suplementares
-        "\U00002702-\U000027B0"  # símbolos diversos
-        "\U000024C2-\U0001F251" 
-        "]+", flags=re.UNICODE
-    )
-    
-    content = emoji_pattern.sub('', content)
-    
-    with open('chatbot_service.py', 'w', encoding='utf-8') as f:
-        f.write(content)
+# Dicionário de substituições
+REPLACEMENTS = {
+    '🚀': 'Inicializando',
+    '🤖': 'CONFIGURACAO', 
+    '🔑': 'API Key',
+    '🌐': 'Endpoint',
+    '⏱️': 'Timeout',
+    '🎯': 'Model',
+    '🌡️': 'Temperature',
+    '✅': 'OK',
+    '💬': 'NOVA QUERY',
+    '📝': 'Query',
+    '👥': 'Candidatos',
+    '💼': 'Vagas',
+    '📡': 'Enviando',
+    '👋': 'Processando',
+    '📄': 'Processando',
+    '🔍': 'Testando',
+    '❌': 'ERROR',
+    '⚠️': 'WARN',
+    '🔥': 'Pontos Fortes',
+    '💡': 'Recomendacao',
+    '❓': 'PERGUNTA',
+}
+
+# Emojis de um codepoint: str.translate (uma passada por linha)
+_TABLE = str.maketrans({emoji: replacement for emoji, replacement in REPLACEMENTS.items() if len(emoji) == 1})
+
+# Sequências com seletor de variação ('⏱️', '🌡️', '⚠️'): só a sequência exata é trocada
+_SEQUENCES = {emoji: replacement for emoji, replacement in REPLACEMENTS.items() if len(emoji) > 1}
+_SEQUENCE_RE = re.compile('|'.join(map(re.escape, _SEQUENCES)))
+
+# Remover outros emojis não listados
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # símbolos & pictogramas
+    "\U0001F680-\U0001F6FF"  # transporte & símbolos
+    "\U0001F700-\U0001F77F"  # alquimia
+    "\U0001F780-\U0001F7FF"  # formas geométricas
+    "\U0001F800-\U0001F8FF"  # setas suplementares
+    "\U0001F900-\U0001F9FF"  # símbolos suplementares
+    "\U0001FA00-\U0001FA6F"  # símbolos de xadrez
+    "\U0001FA70-\U0001FAFF"  # símbolos suplementares
+    "\U00002702-\U000027B0"  # símbolos diversos
+    "\U000024C2-\U0001F251" 
+    "]+", flags=re.UNICODE
+)
+
+
+def _replace_known(text):
+    """Troca os emojis de REPLACEMENTS pelo texto correspondente"""
+    return _SEQUENCE_RE.sub(lambda match: _SEQUENCES[match.group()], text).translate(_TABLE)
+
+
+def remove_emojis(path='chatbot_service.py'):
+    # Reescreve o arquivo linha a linha (fileinput redireciona stdout para o arquivo)
+    with fileinput.input(path, inplace=True, encoding='utf-8') as f:
+        for line in f:
+            sys.stdout.write(_EMOJI_RE.sub('', _replace_known(line)))
     
     print("✅ Todos os emojis foram removidos!")
 
@@ -9,7 +9,7 @@ EXECUÇÃO EM PRODUÇÃO (Render):
 """
 
 from app import app, db, User
-from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import select
 import os
 
 
@@ -26,53 +26,53 @@ def create_admin():
 
         print("🔍 Verificando usuário admin...")
 
-        existing_user = User.query.filter_by(username=ADMIN_USERNAME).first()
+        existing_user = db.session.execute(
+            select(User).where(User.username == ADMIN_USERNAME)
+        ).scalar_one_or_none()
 
-        if existing_user:
-            print("⚠️ Usuário admin já existe")
-            print(f"   ID: {existing_user.id}")
-            print(f"   Email: {existing_user.email}")
+        # Já sincronizado: evita gerar um novo hash (KDF caro) a cada deploy
+        if (existing_user and existing_user.is_admin and existing_user.password_hash
+                and existing_user.check_password(ADMIN_PASSWORD)):
+            print("✅ Usuário admin já sincronizado - nada a fazer")
+            return
 
-            print("🔄 Resetando senha...")
-            existing_user.password_hash = generate_password_hash(ADMIN_PASSWORD)
-            existing_user.is_admin = True
+        try:
+            if existing_user:
+                print("⚠️ Usuário admin já existe")
+                print(f"   ID: {existing_user.id}")
+                print(f"   Email: {existing_user.email}")
 
-            db.session.commit()
-            print("✅ Senha resetada com sucesso!")
-
-        else:
-            print("🔧 Criando novo usuário admin...")
-
-            admin = User(
-                username=ADMIN_USERNAME,
-                email=ADMIN_EMAIL,
-                password_hash=generate_password_hash(ADMIN_PASSWORD),
-                is_admin=True
-            )
-
-            try:
-                db.session.add(admin)
-                db.session.commit()
-                print("✅ Usuário admin criado com sucesso!")
-            except Exception as e:
-                db.session.rollback()
-                print(f"❌ Erro ao criar admin: {e}")
-                return
+                print("🔄 Resetando senha...")
+                existing_user.set_password(ADMIN_PASSWORD)
+                existing_user.is_admin = True
+                user = existing_user
 
-        # 🔍 Verificação final
-        user = User.query.filter_by(username=ADMIN_USERNAME).first()
+            else:
+                print("🔧 Criando novo usuário admin...")
 
-        if not user:
-            print("❌ ERRO CRÍTICO: Usuário não encontrado após commit!")
+                user = User(
+                    username=ADMIN_USERNAME,
+                    email=ADMIN_EMAIL,
+                    is_admin=True
+                )
+                user.set_password(ADMIN_PASSWORD)
+                db.session.add(user)
+
+            db.session.commit()
+            print("✅ Usuário admin sincronizado com sucesso!")
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ Erro ao sincronizar admin: {e}")
             return
 
+        # 🔍 Verificação final
         print("\n✅ VERIFICAÇÃO FINAL")
         print(f"   ID: {user.id}")
         print(f"   Username: {user.username}")
         print(f"   Email: {user.email}")
         print(f"   Admin: {user.is_admin}")
 
-        senha_ok = check_password_hash(user.password_hash, ADMIN_PASSWORD)
+        senha_ok = user.check_password(ADMIN_PASSWORD)
         print(f"   Teste de senha: {'OK' if senha_ok else 'FALHOU'}")
 
         print("\n🔑 CREDENCIAIS ATIVAS")
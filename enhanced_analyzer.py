@@ -4,105 +4,446 @@ Enhanced CV Analyzer - Analisador de Currículos Avançado
 Sistema de análise inteligente sem necessidade de API externa
 """
 
+import hashlib
+import io
+import logging
+import multiprocessing
+import os
 import re
-from typing import Dict, List, Tuple
+import threading
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from typing import ClassVar, Dict, List, Tuple
 from datetime import datetime
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+try:
+    # Opcional: cache persistente em disco dos resultados de analyze()
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    # Opcional: multi-pattern DFA (uma passada para todas as tecnologias)
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    # Opcional: trie estática compacta para o índice tecnologia -> categorias
+    import marisa_trie
+except ImportError:
+    marisa_trie = None
+
+try:
+    # Opcional: compila o cálculo de scores para código nativo (útil em lote)
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Sem numba: mantém a função Python original"""
+        def decorator(func):
+            return func
+        return decorator
+
+
+def _build_trie_regex(words) -> str:
+    """
+    Monta uma alternação compactada em trie para uma lista de palavras
+    Ex: ['abc', 'abd', 'ef'] -> (?:ab(?:c|d)|ef)
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def to_regex(node):
+        branches = [re.escape(char) + to_regex(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1 and '' not in node:
+            return branches[0]
+        # Quantificador guloso: a palavra mais longa é tentada primeiro
+        return '(?:' + '|'.join(branches) + ')' + ('?' if '' in node else '')
+    
+    return to_regex(trie)
+
+
+def _fingerprint_value(value):
+    """Forma estável de uma constante (repr determinístico) para a chave do cache em disco"""
+    if isinstance(value, re.Pattern):
+        # repr de regex compilada é truncado: usa o padrão completo
+        return ('re', value.pattern, value.flags)
+    if isinstance(value, (dict, MappingProxyType)):
+        return tuple((key, _fingerprint_value(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_fingerprint_value(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(_fingerprint_value(item)) for item in value))
+    return value
+
+
+@njit(cache=True)
+def _score_kernel(tech_score, years, action_verbs, resp_count, mentor_count, mentor_has_evidence,
+                  proj_count, cv_length, seniority_mult, education_score):
+    """
+    Núcleo numérico de _calculate_scores_calibrated (só escalares, compilável pelo numba)
+    
+    Returns:
+        (technical, experience, soft_skills, projects, overall) sem arredondamento
+    """
+    
+    # 1. Score técnico (baseado em match real)
+    technical = tech_score
+    
+    # Penalizar se CV é muito curto (menos de 500 chars)
+    if cv_length < 500:
+        technical *= 0.8
+    
+    # 2. Score de experiência (mais realista)
+    if years >= 8:
+        exp_score = 9.0
+    elif years >= 5:
+        exp_score = 8.0
+    elif years >= 3:
+        exp_score = 7.0
+    elif years >= 2:
+        exp_score = 6.0
+    else:
+        exp_score = 5.0
+    
+    # Bonus por verbos de ação (até +1.0)
+    action_bonus = min(1.0, action_verbs * 0.1)
+    exp_score = min(10.0, exp_score + action_bonus)
+    
+    # 3. Score de soft skills (mais criterioso)
+    soft = 5.5  # Base mais realista
+    
+    if resp_count >= 3:
+        soft += 2.5
+    elif resp_count >= 2:
+        soft += 1.5
+    elif resp_count > 1:
+        soft += 0.8
+    
+    if mentor_count >= 2:
+        soft += 1.5
+    elif mentor_has_evidence:
+        soft += 0.5
+    
+    soft = min(10.0, soft)
+    
+    # 4. Score de projetos (calibrado)
+    if proj_count >= 10:
+        project_score = 8.5
+    elif proj_count >= 5:
+        project_score = 7.0
+    elif proj_count >= 3:
+        project_score = 6.0
+    else:
+        project_score = 4.5
+    
+    # 5. Score overall ponderado (mais realista)
+    overall = (
+        technical * 0.35 +      # 35% técnico
+        exp_score * 0.30 +      # 30% experiência
+        soft * 0.20 +           # 20% soft skills
+        project_score * 0.15    # 15% projetos
+    )
+    
+    # Aplicar multiplicador de senioridade (com menos impacto)
+    seniority_factor = 0.9 + (seniority_mult - 1.0) * 0.5
+    overall *= seniority_factor
+    
+    # Bonus por formação (+0.5 a +1.5)
+    education_bonus = education_score * 0.2
+    overall = min(10.0, overall + education_bonus)
+    
+    # Garantir que scores fazem sentido
+    overall = max(2.0, min(10.0, overall))
+    
+    return technical, exp_score, soft, project_score, overall
+
 
 class EnhancedCVAnalyzer:
     """Analisador de currículos avançado com análise detalhada e estruturada"""
     
-    def __init__(self):
-        # Tecnologias categorizadas
-        self.tech_stack = {
-            'Linguagens de Programação': [
-                'python', 'java', 'javascript', 'typescript', 'c#', 'c++', 'php', 
-                'ruby', 'go', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab',
-                'perl', 'dart', 'elixir', 'haskell', 'lua', 'bash', 'shell'
-            ],
-            'Frameworks Web': [
-                'react', 'angular', 'vue', 'svelte', 'django', 'flask', 'fastapi',
-                'spring', 'laravel', 'rails', 'express', 'nest', 'next', 'nuxt',
-                'gatsby', 'remix', 'solid', 'qwik', 'astro'
-            ],
-            'Bancos de Dados': [
-                'mysql', 'postgresql', 'mongodb', 'oracle', 'sql server', 'redis',
-                'cassandra', 'dynamodb', 'elasticsearch', 'mariadb', 'sqlite',
-                'neo4j', 'couchdb', 'influxdb', 'clickhouse', 'sql'
-            ],
-            'Cloud & DevOps': [
-                'aws', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes',
-                'jenkins', 'gitlab', 'github actions', 'terraform', 'ansible',
-                'circleci', 'travis', 'heroku', 'vercel', 'netlify', 'digitalocean'
-            ],
-            'Ferramentas & Metodologias': [
-                'git', 'jira', 'scrum', 'agile', 'kanban', 'rest', 'graphql',
-                'microservices', 'api', 'tdd', 'ci/cd', 'devops', 'solid',
-                'clean code', 'design patterns'
-            ],
-            'Data Science & IA': [
-                'machine learning', 'deep learning', 'tensorflow', 'pytorch',
-                'scikit-learn', 'pandas', 'numpy', 'jupyter', 'data analysis',
-                'power bi', 'tableau', 'keras', 'spark', 'hadoop', 'airflow'
-            ],
-            'Business Intelligence': [
-                'power bi', 'tableau', 'qlik', 'looker', 'metabase', 'excel avançado',
-                'dax', 'powerquery', 'sap', 'salesforce', 'microsoft excel'
-            ],
-            'Mobile': [
-                'react native', 'flutter', 'ionic', 'xamarin', 'android',
-                'ios', 'swift', 'kotlin', 'objective-c'
-            ]
-        }
-        
-        # Palavras-chave de ação (verbos de realização)
-        self.action_verbs = [
-            'desenvolveu', 'implementou', 'criou', 'liderou', 'gerenciou',
-            'coordenou', 'projetou', 'arquitetou', 'otimizou', 'melhorou',
-            'automatizou', 'integrou', 'migrou', 'refatorou', 'escalou',
-            'deployed', 'built', 'created', 'led', 'managed', 'designed',
-            'maintained', 'tested', 'debugged', 'configured', 'desenvolvido',
-            'realizado', 'executado', 'implantado'
-        ]
-        
-        # Indicadores de senioridade
-        self.seniority_indicators = {
-            'Junior': {
-                'keywords': ['júnior', 'junior', 'jr', 'estagiário', 'trainee', 'assistente', 'intern', 'iniciante'],
-                'years_range': (0, 2),
-                'score_multiplier': 0.85
-            },
-            'Pleno': {
-                'keywords': ['pleno', 'analista', 'desenvolvedor', 'developer', 'engineer', 'programador'],
-                'years_range': (2, 5),
-                'score_multiplier': 1.0
-            },
-            'Sênior': {
-                'keywords': ['sênior', 'senior', 'sr', 'especialista', 'specialist', 'lead', 'principal', 'sênior'],
-                'years_range': (5, 100),
-                'score_multiplier': 1.15
-            },
-            'Expert': {
-                'keywords': ['arquiteto', 'architect', 'tech lead', 'staff', 'principal', 'head', 'diretor', 'gerente'],
-                'years_range': (8, 100),
-                'score_multiplier': 1.25
+    # Padrões pré-compilados, compartilhados entre instâncias
+    
+    # Anos de experiência explícitos
+    # (palavra obrigatória no match, padrão): sem a palavra no texto o padrão nem roda
+    _EXPERIENCE_PATTERNS = (
+        ('experiência', re.compile(r'(\d+)\s*(?:\+)?\s*anos?\s+de\s+experiência')),
+        ('experiência', re.compile(r'experiência\s+de\s+(\d+)\s*(?:\+)?\s*anos?')),
+        ('experience', re.compile(r'(\d+)\s*(?:\+)?\s*years?\s+(?:of\s+)?experience')),
+    )
+    
+    # Todos os padrões de anos exigem dígitos
+    _ANY_DIGIT_RE = re.compile(r'\d')
+    
+    # Períodos de trabalho (formato YYYY - YYYY)
+    _WORK_PERIOD_RE = re.compile(r'(\d{4})\s*[-–até]\s*(\d{4}|\bpresente\b|\batual\b|present|atual)')
+    
+    # Palavras que indicam projetos/implementações
+    PROJECT_KEYWORDS = (
+        'projeto', 'project', 'desenvolveu', 'implementou', 'criou',
+        'built', 'created', 'developed', 'implemented', 'launched',
+        'desenvolvido', 'implantado', 'executado'
+    )
+    MAX_PROJECT_COUNT = 15
+    _PROJECT_COUNT_RE = re.compile(r'\b' + _build_trie_regex(PROJECT_KEYWORDS) + r'\b')
+    
+    # Indicadores de complexidade: (termos, descrição)
+    _COMPLEXITY_GROUPS = tuple((re.compile(terms), description) for terms, description in (
+        ('arquitetura|architecture', "Experiência em arquitetura de software"),
+        ('microserviços|microservices', "Trabalho com microserviços"),
+        ('escalabilidade|performance|otimização|optimization', "Foco em performance e escalabilidade"),
+        ('migração|refatoração|modernização|migration', "Experiência em modernização de sistemas"),
+    ))
+    
+    # Indicadores de liderança: (keyword, descrição)
+    LEADERSHIP_KEYWORDS = (
+        ('líder', 'Atuação como líder de equipe'),
+        ('lead', 'Liderança técnica'),
+        ('coordenação', 'Coordenação de projetos'),
+        ('gestão', 'Gestão de equipe/projetos'),
+        ('coordenador', 'Coordenação'),
+        ('gerente', 'Gestão')
+    )
+    
+    # Indicadores de mentoria: (keywords, descrição)
+    MENTORSHIP_KEYWORDS = (
+        (('mentor', 'mentoria'), "Experiência em mentoria"),
+        (('treinamento', 'training'), "Treinamento de equipe"),
+        (('code review', 'revisão'), "Participação em code reviews")
+    )
+    
+    # Tecnologias categorizadas
+    TECH_STACK = MappingProxyType({
+        'Linguagens de Programação': (
+            'python', 'java', 'javascript', 'typescript', 'c#', 'c++', 'php', 
+            'ruby', 'go', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab',
+            'perl', 'dart', 'elixir', 'haskell', 'lua', 'bash', 'shell'
+        ),
+        'Frameworks Web': (
+            'react', 'angular', 'vue', 'svelte', 'django', 'flask', 'fastapi',
+            'spring', 'laravel', 'rails', 'express', 'nest', 'next', 'nuxt',
+            'gatsby', 'remix', 'solid', 'qwik', 'astro'
+        ),
+        'Bancos de Dados': (
+            'mysql', 'postgresql', 'mongodb', 'oracle', 'sql server', 'redis',
+            'cassandra', 'dynamodb', 'elasticsearch', 'mariadb', 'sqlite',
+            'neo4j', 'couchdb', 'influxdb', 'clickhouse', 'sql'
+        ),
+        'Cloud & DevOps': (
+            'aws', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes',
+            'jenkins', 'gitlab', 'github actions', 'terraform', 'ansible',
+            'circleci', 'travis', 'heroku', 'vercel', 'netlify', 'digitalocean'
+        ),
+        'Ferramentas & Metodologias': (
+            'git', 'jira', 'scrum', 'agile', 'kanban', 'rest', 'graphql',
+            'microservices', 'api', 'tdd', 'ci/cd', 'devops', 'solid',
+            'clean code', 'design patterns'
+        ),
+        'Data Science & IA': (
+            'machine learning', 'deep learning', 'tensorflow', 'pytorch',
+            'scikit-learn', 'pandas', 'numpy', 'jupyter', 'data analysis',
+            'power bi', 'tableau', 'keras', 'spark', 'hadoop', 'airflow'
+        ),
+        'Business Intelligence': (
+            'power bi', 'tableau', 'qlik', 'looker', 'metabase', 'excel avançado',
+            'dax', 'powerquery', 'sap', 'salesforce', 'microsoft excel'
+        ),
+        'Mobile': (
+            'react native', 'flutter', 'ionic', 'xamarin', 'android',
+            'ios', 'swift', 'kotlin', 'objective-c'
+        )
+    })
+    
+    # Pares (tecnologia, categoria) achatados, na ordem de TECH_STACK
+    _TECH_FLAT = tuple((tech, category) for category, techs in TECH_STACK.items() for tech in techs)
+    
+    # Palavras-chave de ação (verbos de realização)
+    ACTION_VERBS = (
+        'desenvolveu', 'implementou', 'criou', 'liderou', 'gerenciou',
+        'coordenou', 'projetou', 'arquitetou', 'otimizou', 'melhorou',
+        'automatizou', 'integrou', 'migrou', 'refatorou', 'escalou',
+        'deployed', 'built', 'created', 'led', 'managed', 'designed',
+        'maintained', 'tested', 'debugged', 'configured', 'desenvolvido',
+        'realizado', 'executado', 'implantado'
+    )
+    
+    # Indicadores de senioridade
+    SENIORITY_INDICATORS = MappingProxyType({
+        'Junior': MappingProxyType({
+            'keywords': ('júnior', 'junior', 'jr', 'estagiário', 'trainee', 'assistente', 'intern', 'iniciante'),
+            'years_range': (0, 2),
+            'score_multiplier': 0.85
+        }),
+        'Pleno': MappingProxyType({
+            'keywords': ('pleno', 'analista', 'desenvolvedor', 'developer', 'engineer', 'programador'),
+            'years_range': (2, 5),
+            'score_multiplier': 1.0
+        }),
+        'Sênior': MappingProxyType({
+            'keywords': ('sênior', 'senior', 'sr', 'especialista', 'specialist', 'lead', 'principal', 'sênior'),
+            'years_range': (5, 100),
+            'score_multiplier': 1.15
+        }),
+        'Expert': MappingProxyType({
+            'keywords': ('arquiteto', 'architect', 'tech lead', 'staff', 'principal', 'head', 'diretor', 'gerente'),
+            'years_range': (8, 100),
+            'score_multiplier': 1.25
+        })
+    })
+    
+    # Formação acadêmica
+    EDUCATION_LEVELS = MappingProxyType({
+        'ensino médio': 1,
+        'técnico': 2,
+        'tecnólogo': 3,
+        'graduação': 4,
+        'bacharelado': 4,
+        'licenciatura': 4,
+        'pós-graduação': 5,
+        'especialização': 5,
+        'mba': 5,
+        'mestrado': 6,
+        'doutorado': 7,
+        'phd': 7
+    })
+    
+    # Tamanho dos caches de memoização
+    ANALYZE_CACHE_SIZE = 256    # resultados completos de analyze()
+    TEXT_CACHE_SIZE = 1024      # extrações por texto (tecnologias, experiência, ...)
+    
+    # Loga início/fim de cada análise (desligado: custo de I/O em lote)
+    VERBOSE: ClassVar[bool] = False
+    
+    # Abaixo disso analyze_batch roda no próprio processo (abrir o pool custa mais)
+    BATCH_MIN_PARALLEL = 32
+    
+    # Cache em disco (requer diskcache): desligado por padrão, ativado com ANALYZE_CACHE_DIR
+    DISK_CACHE_DIR = os.getenv('ANALYZE_CACHE_DIR', '')
+    
+    # Configurações que não mudam o resultado: ficam fora da chave do cache em disco
+    _CACHE_NEUTRAL = frozenset({
+        'ANALYZE_CACHE_SIZE', 'TEXT_CACHE_SIZE', 'VERBOSE', 'BATCH_MIN_PARALLEL',
+        'DISK_CACHE_DIR', '_CACHE_NEUTRAL',
+    })
+    
+    # Estruturas derivadas (regex, trie, banco hyperscan...), montadas uma vez por processo
+    _prepared = False
+    _prepare_lock = threading.Lock()
+    _hs_lock = threading.Lock()
+    
+    @classmethod
+    def _ensure_prepared(cls):
+        """Monta as estruturas derivadas das constantes na primeira instância"""
+        if cls._prepared:
+            return
+        
+        with cls._prepare_lock:
+            if cls._prepared:
+                return
+            
+            cls._analysis_key = cls._analysis_fingerprint()
+            
+            # Índice tecnologia -> categorias (uma tecnologia pode estar em mais de uma)
+            tech_to_categories = {}
+            for tech, category in cls._TECH_FLAT:
+                tech_to_categories.setdefault(tech, []).append(category)
+            cls._tech_to_categories = {tech: tuple(categories) for tech, categories in tech_to_categories.items()}
+            
+            # Regex única (trie) para todas as tecnologias: uma passada no texto
+            # (o texto chega em minúsculas, então não precisa de re.IGNORECASE).
+            # O lookahead não consome texto: tecnologias sobrepostas ('microsoft excel'
+            # e 'excel avançado' em 'microsoft excel avançado') são todas encontradas
+            cls._tech_regex = re.compile(r'\b(?=(' + _build_trie_regex(tech_to_categories) + r')\b)')
+            
+            # Tecnologias contidas em outra (ex: 'react' em 'react native'): em cada posição
+            # só o match mais longo é retornado, então as contidas são creditadas junto
+            cls._tech_contained = {
+                tech: [other for other in tech_to_categories
+                       if other != tech and re.search(r'\b' + re.escape(other) + r'\b', tech)]
+                for tech in tech_to_categories
             }
-        }
-        
-        # Formação acadêmica
-        self.education_levels = {
-            'ensino médio': 1,
-            'técnico': 2,
-            'tecnólogo': 3,
-            'graduação': 4,
-            'bacharelado': 4,
-            'licenciatura': 4,
-            'pós-graduação': 5,
-            'especialização': 5,
-            'mba': 5,
-            'mestrado': 6,
-            'doutorado': 7,
-            'phd': 7
-        }
+            
+            # Com hyperscan instalado, uma passada encontra as tecnologias presentes como
+            # substring; o word boundary é confirmado só nelas (\b não é suportado em UTF-8/UCP)
+            cls._tech_ids = tuple(tech_to_categories)
+            cls._hs_db = cls._build_hyperscan_db(cls._tech_ids) if hyperscan else None
+            cls._tech_patterns = {
+                tech: re.compile(r'\b' + re.escape(tech) + r'\b') for tech in cls._tech_ids
+            } if cls._hs_db is not None else {}
+            
+            # Com marisa_trie, as categorias de cada tecnologia viram uma máscara de bits
+            # num array int32 indexado pelo key_id da trie (bem mais compacto que o dict)
+            categories = tuple(cls.TECH_STACK)
+            cls._tech_trie = None
+            if marisa_trie is not None and len(categories) < 32:
+                trie = marisa_trie.Trie(cls._tech_ids)
+                category_bit = {category: 1 << i for i, category in enumerate(categories)}
+                masks = array('i', bytes(4 * len(trie)))
+                for tech, category in cls._TECH_FLAT:
+                    masks[trie.key_id(tech)] |= category_bit[category]
+                cls._tech_trie = trie
+                cls._tech_cat_masks = masks
+                cls._mask_categories = {
+                    mask: tuple(category for category in categories if mask & category_bit[category])
+                    for mask in set(masks)
+                }
+            
+            # Keywords de senioridade por prioridade (do maior pro menor), sem redundâncias:
+            # uma keyword que contém outra do mesmo nível ou de nível maior nunca decide o
+            # resultado ('principal' já é testada em Expert, 'sênior' está duplicada)
+            cls._seniority_order = ('Expert', 'Sênior', 'Pleno', 'Junior')
+            cls._seniority_mult = {
+                level: data['score_multiplier'] for level, data in cls.SENIORITY_INDICATORS.items()
+            }
+            seniority_scan = []
+            checked = set()
+            for level in cls._seniority_order:
+                level_keywords = cls.SENIORITY_INDICATORS[level]['keywords']
+                new_keywords = [k for k in dict.fromkeys(level_keywords) if k not in checked]
+                checked.update(level_keywords)
+                keywords = tuple(k for k in new_keywords if not any(other != k and other in k for other in checked))
+                seniority_scan.append((level, keywords))
+            cls._seniority_scan = tuple(seniority_scan)
+            
+            # Formações do maior pro menor nível (empate: ordem original), para parar no primeiro achado
+            cls._education_scan = tuple(sorted(cls.EDUCATION_LEVELS.items(), key=lambda item: -item[1]))
+            
+            cls._prepared = True
+    
+    def __init__(self):
+        self._ensure_prepared()
+        
+        # Memoização: cada etapa depende só do texto, então é cacheada por texto
+        # (a mesma vaga contra vários CVs reaproveita a extração da vaga)
+        for method in ('_extract_all_technologies', '_analyze_experience', '_analyze_projects',
+                       '_analyze_leadership', '_analyze_education'):
+            setattr(self, method, lru_cache(maxsize=self.TEXT_CACHE_SIZE)(getattr(self, method)))
+        
+        # Cache do resultado completo, chaveado por (cv_text, job_description)
+        self._analyze_cache = OrderedDict()
+        self._analyze_cache_lock = threading.Lock()
+        
+        # Segundo nível, em disco: sobrevive a reinícios do processo
+        self._disk_cache = None
+        if diskcache is not None and self.DISK_CACHE_DIR:
+            try:
+                # Resultados contêm dados de candidatos: diretório só do próprio usuário
+                os.makedirs(self.DISK_CACHE_DIR, mode=0o700, exist_ok=True)
+                self._disk_cache = diskcache.Cache(self.DISK_CACHE_DIR)
+            except OSError:
+                # Diretório inacessível: segue só com o cache em memória
+                self._disk_cache = None
 
     def analyze(self, cv_text: str, job_description: str, candidate_name: str = "Candidato") -> Dict:
         """
@@ -111,27 +452,73 @@ class EnhancedCVAnalyzer:
         Returns:
             Dict com análise estruturada compatível com o sistema
         """
+        return self._analyze(cv_text, job_description)
+
+    @classmethod
+    def analyze_batch(cls, cv_texts: List[str], job_description: str, n_workers: int = None) -> List[Dict]:
+        """
+        Analisa vários CVs contra a mesma vaga
+        (a vaga é extraída uma vez; lotes grandes são divididos entre processos)
+        
+        Returns:
+            Lista de resultados na mesma ordem de cv_texts
+        """
+        cv_texts = list(cv_texts)
+        n_workers = min(n_workers or os.cpu_count() or 1, len(cv_texts))
+        
+        analyzer = cls()
+        job_tech = analyzer._extract_all_technologies(job_description.lower())
         
-        print("🔍 Iniciando Enhanced Analysis...")
+        if n_workers <= 1 or len(cv_texts) < cls.BATCH_MIN_PARALLEL:
+            return [analyzer._analyze(cv_text, job_description, job_tech) for cv_text in cv_texts]
+        
+        with multiprocessing.Pool(n_workers, initializer=_batch_worker_init,
+                                  initargs=(cls, job_description, job_tech)) as pool:
+            return pool.map(_batch_worker, cv_texts)
+
+    def _analyze(self, cv_text: str, job_description: str, job_tech: Dict = None) -> Dict:
+        """Implementação de analyze(); job_tech já extraído pode ser reaproveitado"""
+        
+        cache_key = (cv_text, job_description)
+        with self._analyze_cache_lock:
+            cached = self._analyze_cache.get(cache_key)
+            if cached is not None:
+                self._analyze_cache.move_to_end(cache_key)
+        
+        disk_key = None
+        if cached is None and self._disk_cache is not None:
+            disk_key = self._disk_cache_key(cv_text, job_description)
+            cached = self._disk_cache.get(disk_key)
+            if cached is not None:
+                self._remember(cache_key, cached)
+        
+        if cached is not None:
+            # Timestamp reflete a chamada atual, não a original
+            result = dict(cached)
+            result['analysis_timestamp'] = datetime.now().isoformat()
+            return result
+        
+        if self.VERBOSE:
+            logger.info("Iniciando Enhanced Analysis...")
         
         cv_lower = cv_text.lower()
-        job_lower = job_description.lower()
         
         # 1. Extrair todas as tecnologias
         cv_tech = self._extract_all_technologies(cv_lower)
-        job_tech = self._extract_all_technologies(job_lower)
+        if job_tech is None:
+            job_tech = self._extract_all_technologies(job_description.lower())
         
         # 2. Calcular match de tecnologias
         tech_match = self._calculate_tech_match(cv_tech, job_tech)
         
         # 3. Analisar experiência profissional
-        experience_data = self._analyze_experience(cv_text)
+        experience_data = self._analyze_experience(cv_lower)
         
         # 4. Analisar senioridade
         seniority = self._detect_seniority(cv_lower, experience_data['years'])
         
         # 5. Analisar projetos e complexidade
-        projects_data = self._analyze_projects(cv_text)
+        projects_data = self._analyze_projects(cv_lower)
         
         # 6. Analisar liderança
         leadership = self._analyze_leadership(cv_lower)
@@ -151,10 +538,11 @@ class EnhancedCVAnalyzer:
             leadership, seniority, scores, cv_tech
         )
         
-        print(f"✅ Enhanced Analysis concluída - Score: {scores['overall']:.1f}/10")
+        if self.VERBOSE:
+            logger.info("Enhanced Analysis concluída - Score: %.1f/10", scores['overall'])
         
         # Retornar no formato esperado pelo sistema
-        return {
+        result = {
             # Informações básicas
             "contact_info": {
                 "email": "Extrair do formulário",
@@ -173,9 +561,9 @@ class EnhancedCVAnalyzer:
             "experience_summary": f"{seniority['level']} • {experience_data['years']:.0f} anos • {len(cv_tech['all_skills'])} skills identificadas",
             
             # Indicadores de liderança e complexidade
-            "leadership_responsibilities": leadership['responsibilities'],
-            "complexity_indicators": projects_data['complexity_indicators'],
-            "mentorship_indicators": leadership['mentorship'],
+            "leadership_responsibilities": list(leadership['responsibilities']),
+            "complexity_indicators": list(projects_data['complexity_indicators']),
+            "mentorship_indicators": list(leadership['mentorship']),
             
             # Análise qualitativa
             "strengths": feedback['strengths'],
@@ -208,34 +596,105 @@ class EnhancedCVAnalyzer:
             "education_level": education['level'],
             "analysis_note": "✅ Análise avançada com múltiplos critérios"
         }
+        
+        self._remember(cache_key, result)
+        if disk_key is not None:
+            self._disk_cache.set(disk_key, result)
+        
+        return dict(result)
+
+    def _remember(self, cache_key: Tuple[str, str], result: Dict):
+        """Guarda o resultado no cache em memória (LRU)"""
+        with self._analyze_cache_lock:
+            self._analyze_cache[cache_key] = result
+            if len(self._analyze_cache) > self.ANALYZE_CACHE_SIZE:
+                self._analyze_cache.popitem(last=False)
+
+    @classmethod
+    def _analysis_fingerprint(cls) -> str:
+        """
+        Hash das constantes da análise (tecnologias, palavras-chave, padrões) e do
+        núcleo de scores: qualquer mudança nelas invalida o cache em disco
+        """
+        constants = [
+            (name, _fingerprint_value(value)) for name, value in sorted(vars(cls).items())
+            if name.lstrip('_').isupper() and name not in cls._CACHE_NEUTRAL
+        ]
+        kernel = getattr(_score_kernel, 'py_func', _score_kernel).__code__
+        content = repr((constants, kernel.co_code, kernel.co_consts))
+        return hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+    def _disk_cache_key(self, cv_text: str, job_description: str) -> str:
+        """Chave do cache em disco: hash BLAKE2b do par (CV, vaga) + hash das constantes da análise"""
+        content = f"{self._analysis_key}\x00{cv_text}\x00{job_description}"
+        return hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _build_hyperscan_db(techs):
+        """Compila todas as tecnologias num único banco hyperscan (busca literal)"""
+        expressions = [re.escape(tech).encode('utf-8') for tech in techs]
+        flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SINGLEMATCH
+        try:
+            db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            db.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=[flags] * len(expressions)
+            )
+            return db
+        except hyperscan.error:
+            # Sem o banco, usa a regex em trie
+            return None
 
-    def _extract_all_technologies(self, text: str) -> Dict:
-        """Extrai todas as tecnologias por categoria"""
+    def _match_technologies(self, text_lower: str) -> set:
+        """Retorna as tecnologias (em minúsculas) presentes no texto"""
+        hits = set()
         
-        found = {}
-        all_skills = []
+        if self._hs_db is not None:
+            def on_match(tech_id, start, end, flags, context):
+                hits.add(self._tech_ids[tech_id])
+            
+            # O scratch do banco não pode ser usado por duas threads ao mesmo tempo
+            with self._hs_lock:
+                self._hs_db.scan(text_lower.encode('utf-8'), match_event_handler=on_match)
+            return {tech for tech in hits if self._tech_patterns[tech].search(text_lower)}
+        
+        for match in self._tech_regex.finditer(text_lower):
+            hit = match.group(1)
+            hits.add(hit)
+            hits.update(self._tech_contained[hit])
+        return hits
+
+    def _extract_all_technologies(self, text_lower: str) -> Dict:
+        """Extrai todas as tecnologias por categoria (texto já em minúsculas)"""
         
-        for category, techs in self.tech_stack.items():
-            category_skills = []
-            for tech in techs:
-                # Busca mais precisa com word boundaries
-                pattern = r'\b' + re.escape(tech) + r'\b'
-                if re.search(pattern, text, re.IGNORECASE):
-                    skill_name = tech.title()
-                    category_skills.append(skill_name)
-                    all_skills.append(skill_name)
-            found[category] = category_skills
+        found = {category: set() for category in self.TECH_STACK}
+        all_skills_lower = self._match_technologies(text_lower)
+        
+        for tech in all_skills_lower:
+            skill_name = tech.title()
+            for category in self._categories_of(tech):
+                found[category].add(skill_name)
         
         return {
-            'by_category': found,
-            'all_skills': list(set(all_skills))
+            'by_category': {category: list(skills) for category, skills in found.items()},
+            'all_skills': [tech.title() for tech in all_skills_lower],
+            # Mesmas skills em minúsculas, para o cálculo de match sem reconverter
+            'all_skills_lower': all_skills_lower
         }
 
+    def _categories_of(self, tech: str) -> Tuple[str, ...]:
+        """Categorias de uma tecnologia conhecida"""
+        if self._tech_trie is not None:
+            return self._mask_categories[self._tech_cat_masks[self._tech_trie.key_id(tech)]]
+        return self._tech_to_categories[tech]
+
     def _calculate_tech_match(self, cv_tech: Dict, job_tech: Dict) -> Dict:
         """Calcula match detalhado de tecnologias COM CRITÉRIO"""
         
-        cv_skills = set(s.lower() for s in cv_tech['all_skills'])
-        job_skills = set(s.lower() for s in job_tech['all_skills'])
+        cv_skills = cv_tech['all_skills_lower']
+        job_skills = job_tech['all_skills_lower']
         
         if not job_skills:
             # Se não há skills na vaga, avaliar baseado no CV
@@ -250,7 +709,7 @@ class EnhancedCVAnalyzer:
                 score = 4.5
             
             return {
-                'matched': list(cv_skills)[:10],
+                'matched': list(islice(cv_skills, 10)),
                 'missing': [],
                 'percentage': percentage,
                 'score': score
@@ -278,49 +737,39 @@ class EnhancedCVAnalyzer:
             'score': round(score, 1)
         }
 
-    def _analyze_experience(self, text: str) -> Dict:
-        """Analisa anos de experiência de forma robusta"""
-        
-        # Padrões para detectar anos
-        patterns = [
-            r'(\d+)\s*(?:\+)?\s*anos?\s+de\s+experiência',
-            r'experiência\s+de\s+(\d+)\s*(?:\+)?\s*anos?',
-            r'(\d+)\s*(?:\+)?\s*years?\s+(?:of\s+)?experience',
-        ]
+    def _analyze_experience(self, text_lower: str) -> Dict:
+        """Analisa anos de experiência de forma robusta (texto já em minúsculas)"""
         
         years = 0
-        text_lower = text.lower()
+        has_digits = self._ANY_DIGIT_RE.search(text_lower) is not None
         
         # Tentar extrair anos explícitos
-        for pattern in patterns:
-            matches = re.findall(pattern, text_lower)
-            if matches:
-                years = max(years, int(matches[0]))
+        if has_digits:
+            for keyword, pattern in self._EXPERIENCE_PATTERNS:
+                if keyword not in text_lower:
+                    continue
+                match = pattern.search(text_lower)
+                if match:
+                    years = max(years, int(match.group(1)))
         
         # Tentar calcular por períodos de trabalho (formato YYYY - YYYY)
-        work_periods = re.findall(r'(\d{4})\s*[-–até]\s*(\d{4}|\bpresente\b|\batual\b|present|atual)', text_lower)
+        work_periods = self._WORK_PERIOD_RE.findall(text_lower) if has_digits else []
         if work_periods:
             total_years = 0
             current_year = datetime.now().year
             
             for start, end in work_periods:
-                start_year = int(start)
-                if 'present' in end or 'atual' in end or 'presente' in end:
-                    end_year = current_year
-                else:
-                    try:
-                        end_year = int(end)
-                    except:
-                        end_year = current_year
+                # A regex só aceita 4 dígitos ou presente/atual/present no fim do período
+                end_year = int(end) if end[0].isdigit() else current_year
                 
-                period = max(0, end_year - start_year)
-                if period <= 50:  # Validação: período razoável
+                period = end_year - int(start)
+                if 0 <= period <= 50:  # Validação: período razoável
                     total_years += period
             
             years = max(years, total_years)
         
         # Contar verbos de ação (indicador de projetos)
-        action_count = sum(1 for verb in self.action_verbs if verb in text_lower)
+        action_count = sum(1 for verb in self.ACTION_VERBS if verb in text_lower)
         
         # Se não achou anos explícitos mas tem muitos verbos de ação
         if years == 0 and action_count >= 5:
@@ -334,7 +783,7 @@ class EnhancedCVAnalyzer:
             'has_explicit_years': years > 0
         }
 
-    def _detect_seniority(self, text: str, years: float) -> Dict:
+    def _detect_seniority(self, text_lower: str, years: float) -> Dict:
         """Detecta senioridade baseado em keywords e anos"""
         
         detected_level = 'Pleno'
@@ -342,12 +791,11 @@ class EnhancedCVAnalyzer:
         found_keywords = []
         
         # Verificar keywords por ordem de senioridade (do maior pro menor)
-        for level in ['Expert', 'Sênior', 'Pleno', 'Junior']:
-            data = self.seniority_indicators[level]
-            for keyword in data['keywords']:
-                if keyword in text:
+        for level, keywords in self._seniority_scan:
+            for keyword in keywords:
+                if keyword in text_lower:
                     detected_level = level
-                    multiplier = data['score_multiplier']
+                    multiplier = self._seniority_mult[level]
                     found_keywords.append(keyword)
                     break
             if found_keywords:
@@ -357,15 +805,15 @@ class EnhancedCVAnalyzer:
         if years >= 8:
             if detected_level in ['Junior', 'Pleno']:
                 detected_level = 'Sênior'
-                multiplier = self.seniority_indicators['Sênior']['score_multiplier']
+                multiplier = self._seniority_mult['Sênior']
         elif years >= 5:
             if detected_level == 'Junior':
                 detected_level = 'Pleno'
-                multiplier = self.seniority_indicators['Pleno']['score_multiplier']
+                multiplier = self._seniority_mult['Pleno']
         elif years < 2:
             if detected_level in ['Sênior', 'Expert']:
                 detected_level = 'Junior'
-                multiplier = self.seniority_indicators['Junior']['score_multiplier']
+                multiplier = self._seniority_mult['Junior']
         
         return {
             'level': detected_level,
@@ -373,40 +821,22 @@ class EnhancedCVAnalyzer:
             'confidence': 'Alta' if found_keywords else 'Média'
         }
 
-    def _analyze_projects(self, text: str) -> Dict:
-        """Analisa projetos e implementações mencionados"""
-        
-        project_keywords = [
-            'projeto', 'project', 'desenvolveu', 'implementou', 'criou',
-            'built', 'created', 'developed', 'implemented', 'launched',
-            'desenvolvido', 'implantado', 'executado'
-        ]
+    def _analyze_projects(self, text_lower: str) -> Dict:
+        """Analisa projetos e implementações mencionados (texto já em minúsculas)"""
         
-        text_lower = text.lower()
+        # Contar ocorrências com word boundary (uma única regex para todas as palavras),
+        # limitando a contagem para ser realista: para de varrer ao atingir o teto
         count = 0
-        
-        for keyword in project_keywords:
-            # Contar ocorrências únicas com word boundary
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            count += len(re.findall(pattern, text_lower))
-        
-        # Limitar contagem para ser realista
-        count = min(count, 15)
-        
-        complexity_indicators = []
+        for _ in self._PROJECT_COUNT_RE.finditer(text_lower):
+            count += 1
+            if count >= self.MAX_PROJECT_COUNT:
+                break
         
         # Indicadores de complexidade
-        if 'arquitetura' in text_lower or 'architecture' in text_lower:
-            complexity_indicators.append("Experiência em arquitetura de software")
-        
-        if 'microserviços' in text_lower or 'microservices' in text_lower:
-            complexity_indicators.append("Trabalho com microserviços")
-        
-        if any(word in text_lower for word in ['escalabilidade', 'performance', 'otimização', 'optimization']):
-            complexity_indicators.append("Foco em performance e escalabilidade")
-        
-        if any(word in text_lower for word in ['migração', 'refatoração', 'modernização', 'migration']):
-            complexity_indicators.append("Experiência em modernização de sistemas")
+        complexity_indicators = [
+            description for pattern, description in self._COMPLEXITY_GROUPS
+            if pattern.search(text_lower)
+        ]
         
         if count >= 8:
             complexity_indicators.append(f"{count}+ projetos/implementações no histórico")
@@ -420,30 +850,15 @@ class EnhancedCVAnalyzer:
             'complexity_indicators': complexity_indicators
         }
 
-    def _analyze_leadership(self, text: str) -> Dict:
-        """Analisa indicadores de liderança e mentoria"""
+    def _analyze_leadership(self, text_lower: str) -> Dict:
+        """Analisa indicadores de liderança e mentoria (texto já em minúsculas)"""
         
-        leadership_keywords = {
-            'líder': 'Atuação como líder de equipe',
-            'lead': 'Liderança técnica',
-            'coordenação': 'Coordenação de projetos',
-            'gestão': 'Gestão de equipe/projetos',
-            'coordenador': 'Coordenação',
-            'gerente': 'Gestão'
-        }
-        
-        responsibilities = []
-        for keyword, desc in leadership_keywords.items():
-            if keyword in text:
-                responsibilities.append(desc)
+        responsibilities = [desc for keyword, desc in self.LEADERSHIP_KEYWORDS if keyword in text_lower]
         
-        mentorship = []
-        if 'mentor' in text or 'mentoria' in text:
-            mentorship.append("Experiência em mentoria")
-        if 'treinamento' in text or 'training' in text:
-            mentorship.append("Treinamento de equipe")
-        if 'code review' in text or 'revisão' in text:
-            mentorship.append("Participação em code reviews")
+        mentorship = [
+            desc for keywords, desc in self.MENTORSHIP_KEYWORDS
+            if any(keyword in text_lower for keyword in keywords)
+        ]
         
         if not responsibilities:
             responsibilities = ["Experiência técnica individual"]
@@ -456,17 +871,18 @@ class EnhancedCVAnalyzer:
             'mentorship': mentorship
         }
 
-    def _analyze_education(self, text: str) -> Dict:
-        """Analisa formação acadêmica"""
+    def _analyze_education(self, text_lower: str) -> Dict:
+        """Analisa formação acadêmica (texto já em minúsculas)"""
         
         highest_level = 0
         detected = 'Não informado'
         
-        for education, level in self.education_levels.items():
-            if education in text:
-                if level > highest_level:
-                    highest_level = level
-                    detected = education.title()
+        # A primeira formação encontrada já é a de maior nível
+        for education, level in self._education_scan:
+            if education in text_lower:
+                highest_level = level
+                detected = education.title()
+                break
         
         return {
             'level': detected,
@@ -478,75 +894,19 @@ class EnhancedCVAnalyzer:
                                     education: Dict, seniority: Dict, cv_length: int) -> Dict:
         """Calcula todos os scores de forma CALIBRADA e REALISTA"""
         
-        # 1. Score técnico (baseado em match real)
-        technical = tech_match['score']
-        
-        # Penalizar se CV é muito curto (menos de 500 chars)
-        if cv_length < 500:
-            technical *= 0.8
-        
-        # 2. Score de experiência (mais realista)
-        if experience['years'] >= 8:
-            exp_score = 9.0
-        elif experience['years'] >= 5:
-            exp_score = 8.0
-        elif experience['years'] >= 3:
-            exp_score = 7.0
-        elif experience['years'] >= 2:
-            exp_score = 6.0
-        else:
-            exp_score = 5.0
-        
-        # Bonus por verbos de ação (até +1.0)
-        action_bonus = min(1.0, experience['action_verbs_count'] * 0.1)
-        exp_score = min(10.0, exp_score + action_bonus)
-        
-        # 3. Score de soft skills (mais criterioso)
-        soft = 5.5  # Base mais realista
-        
-        if len(leadership['responsibilities']) >= 3:
-            soft += 2.5
-        elif len(leadership['responsibilities']) >= 2:
-            soft += 1.5
-        elif len(leadership['responsibilities']) > 1:
-            soft += 0.8
-        
-        if len(leadership['mentorship']) >= 2:
-            soft += 1.5
-        elif 'Não evidenciado' not in leadership['mentorship']:
-            soft += 0.5
-        
-        soft = min(10.0, soft)
-        
-        # 4. Score de projetos (calibrado)
-        if projects['count'] >= 10:
-            project_score = 8.5
-        elif projects['count'] >= 5:
-            project_score = 7.0
-        elif projects['count'] >= 3:
-            project_score = 6.0
-        else:
-            project_score = 4.5
-        
-        # 5. Score overall ponderado (mais realista)
-        overall = (
-            technical * 0.35 +      # 35% técnico
-            exp_score * 0.30 +      # 30% experiência
-            soft * 0.20 +           # 20% soft skills
-            project_score * 0.15    # 15% projetos
+        technical, exp_score, soft, project_score, overall = _score_kernel(
+            float(tech_match['score']),
+            float(experience['years']),
+            float(experience['action_verbs_count']),
+            float(len(leadership['responsibilities'])),
+            float(len(leadership['mentorship'])),
+            'Não evidenciado' not in leadership['mentorship'],
+            float(projects['count']),
+            float(cv_length),
+            float(seniority['multiplier']),
+            float(education['score'])
         )
         
-        # Aplicar multiplicador de senioridade (com menos impacto)
-        seniority_factor = 0.9 + (seniority['multiplier'] - 1.0) * 0.5
-        overall *= seniority_factor
-        
-        # Bonus por formação (+0.5 a +1.5)
-        education_bonus = education['score'] * 0.2
-        overall = min(10.0, overall + education_bonus)
-        
-        # Garantir que scores fazem sentido
-        overall = max(2.0, min(10.0, overall))
-        
         return {
             'technical': round(technical, 1),
             'experience': round(exp_score, 1),
@@ -637,20 +997,21 @@ class EnhancedCVAnalyzer:
             reason = f"Score {score}/10 - Baixa aderência aos requisitos. Gap técnico significativo e experiência limitada."
         
         # Resumo profissional (detalhado e específico)
-        summary_parts = []
-        summary_parts.append(f"Profissional {seniority['level']} com {int(experience['years'])} ano{'s' if experience['years'] != 1 else ''} de experiência")
+        summary_buf = io.StringIO()
+        summary_buf.write(f"Profissional {seniority['level']} com {int(experience['years'])} ano{'s' if experience['years'] != 1 else ''} de experiência")
         
-        if len(cv_tech['all_skills']) > 0:
+        if cv_tech['all_skills']:
             top_skills = ', '.join(cv_tech['all_skills'][:5])
-            summary_parts.append(f"Domínio de {len(cv_tech['all_skills'])} tecnologias, incluindo {top_skills}")
+            summary_buf.write(f". Domínio de {len(cv_tech['all_skills'])} tecnologias, incluindo {top_skills}")
         
         if projects['count'] >= 3:
-            summary_parts.append(f"{projects['count']}+ projetos/implementações no histórico")
+            summary_buf.write(f". {projects['count']}+ projetos/implementações no histórico")
         
         if tech_match['matched']:
-            summary_parts.append(f"Match com {len(tech_match['matched'])} skills da vaga: {', '.join(tech_match['matched'][:4])}")
+            summary_buf.write(f". Match com {len(tech_match['matched'])} skills da vaga: {', '.join(tech_match['matched'][:4])}")
         
-        summary = ". ".join(summary_parts) + "."
+        summary_buf.write(".")
+        summary = summary_buf.getvalue()
         
         # Riscos (específicos)
         risks = []
@@ -685,10 +1046,34 @@ class EnhancedCVAnalyzer:
         }
 
 
+# Estado de cada processo do pool de analyze_batch
+_batch_analyzer = None
+_batch_job = None
+
+
+def _batch_worker_init(analyzer_cls, job_description: str, job_tech: Dict):
+    """Inicializa o processo: uma instância e a vaga já extraída"""
+    global _batch_analyzer, _batch_job
+    _batch_analyzer = analyzer_cls()
+    _batch_job = (job_description, job_tech)
+
+
+def _batch_worker(cv_text: str) -> Dict:
+    """Analisa um CV do lote contra a vaga do processo"""
+    job_description, job_tech = _batch_job
+    return _batch_analyzer._analyze(cv_text, job_description, job_tech)
+
+
 # Função helper para integração fácil
+_default_analyzer = None
+
+
 def analyze_cv_enhanced(cv_text: str, job_description: str, candidate_name: str = "Candidato") -> Dict:
     """
     Função wrapper para uso direto
+    (reutiliza uma única instância para aproveitar os caches)
     """
-    analyzer = EnhancedCVAnalyzer()
-    return analyzer.analyze(cv_text, job_description, candidate_name)
\ No newline at end of file
+    global _default_analyzer
+    if _default_analyzer is None:
+        _default_analyzer = EnhancedCVAnalyzer()
+    return _default_analyzer.analyze(cv_text, job_description, candidate_name)
\ No newline at end of file
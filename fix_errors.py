@@ -3,53 +3,103 @@ Script para corrigir automaticamente os erros de encoding e API deprecated
 """
 
 import re
+import shutil
 from pathlib import Path
 
-def fix_query_get(file_path: Path):
-    """Substitui Query.get() por db.session.get()"""
-    content = file_path.read_text(encoding='utf-8')
+try:
+    # Opcional: substituição de emojis compilada (útil em arquivos/repositórios grandes)
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+
+# Padrão 1: Model.query.get(id)
+_QUERY_GET_RE = re.compile(r'(\w+)\.query\.get\(([^)]+)\)')
+
+# Mapa de substituições (emojis de um único codepoint)
+_EMOJI_SINGLE = {
+    '✅': '[OK]',
+    '❌': '[ERROR]',
+    '🤖': '[BOT]',
+    '🔑': '[KEY]',
+    '🚀': '[START]',
+    '📊': '[DATA]',
+    '💬': '[CHAT]',
+    '🎯': '[TARGET]',
+    '📄': '[FILE]',
+    '💼': '[JOB]',
+    '👥': '[USERS]',
+    '🌐': '[WEB]',
+    '📡': '[API]',
+    '📥': '[IN]',
+    '📦': '[PKG]',
+    '🔍': '[FIND]',
+    '═': '='
+}
+_EMOJI_TABLE = str.maketrans(_EMOJI_SINGLE)
+
+# A partir desse tamanho (em caracteres) usa o kernel numba em vez do str.translate
+KERNEL_MIN_CHARS = 10_000
+
+if np is not None:
+    # Tabela do kernel: codepoints ordenados (busca binária) e as substituições
+    # concatenadas num único buffer, delimitadas por offsets
+    _KERNEL_KEYS = np.array(sorted(ord(emoji) for emoji in _EMOJI_SINGLE), dtype=np.uint32)
+    _KERNEL_REPL = np.array(
+        [ord(c) for key in _KERNEL_KEYS for c in _EMOJI_SINGLE[chr(key)]], dtype=np.uint32
+    )
+    _KERNEL_OFFSETS = np.cumsum(
+        [0] + [len(_EMOJI_SINGLE[chr(key)]) for key in _KERNEL_KEYS], dtype=np.int64
+    )
+    _KERNEL_MAX_REPL = max(len(replacement) for replacement in _EMOJI_SINGLE.values())
     
-    # Padrão 1: Model.query.get(id)
-    pattern1 = r'(\w+)\.query\.get\(([^)]+)\)'
-    replacement1 = r'db.session.get(\1, \2)'
-    content = re.sub(pattern1, replacement1, content)
+    @njit(cache=True, nogil=True)
+    def _replace_codepoints(text, keys, offsets, repl, out):
+        """Copia text (UTF-32) para out trocando os codepoints de keys; retorna o tamanho"""
+        size = 0
+        n_keys = keys.shape[0]
+        for i in range(text.shape[0]):
+            cp = text[i]
+            j = np.searchsorted(keys, cp)
+            if j < n_keys and keys[j] == cp:
+                for k in range(offsets[j], offsets[j + 1]):
+                    out[size] = repl[k]
+                    size += 1
+            else:
+                out[size] = cp
+                size += 1
+        return size
+
+
+def _translate_emojis(content: str) -> str:
+    """Troca os emojis de um codepoint (kernel numba em textos grandes)"""
+    if np is None or len(content) < KERNEL_MIN_CHARS:
+        return content.translate(_EMOJI_TABLE)
     
-    file_path.write_text(content, encoding='utf-8')
-    print(f"✅ {file_path.name}: Query.get() corrigido")
+    text = np.frombuffer(content.encode('utf-32-le'), dtype=np.uint32)
+    out = np.empty(text.shape[0] * _KERNEL_MAX_REPL, dtype=np.uint32)
+    size = _replace_codepoints(text, _KERNEL_KEYS, _KERNEL_OFFSETS, _KERNEL_REPL, out)
+    return out[:size].tobytes().decode('utf-32-le')
+
+# Emojis com seletor de variação (U+FE0F): dois codepoints, vão por replace
+_EMOJI_MULTI = {
+    '⚠️': '[WARN]',
+    '⏱️': '[TIME]',
+    '🌡️': '[TEMP]'
+}
 
-def fix_emoji_logging(file_path: Path):
+def fix_query_get(content: str) -> str:
+    """Substitui Query.get() por db.session.get()"""
+    return _QUERY_GET_RE.sub(r'db.session.get(\1, \2)', content)
+
+def fix_emoji_logging(content: str) -> str:
     """Remove emojis diretos do código"""
-    content = file_path.read_text(encoding='utf-8')
-    
-    # Mapa de substituições
-    emoji_map = {
-        '✅': '[OK]',
-        '❌': '[ERROR]',
-        '⚠️': '[WARN]',
-        '🤖': '[BOT]',
-        '🔑': '[KEY]',
-        '🚀': '[START]',
-        '📊': '[DATA]',
-        '💬': '[CHAT]',
-        '🎯': '[TARGET]',
-        '📄': '[FILE]',
-        '💼': '[JOB]',
-        '👥': '[USERS]',
-        '🌐': '[WEB]',
-        '⏱️': '[TIME]',
-        '🌡️': '[TEMP]',
-        '📡': '[API]',
-        '📥': '[IN]',
-        '📦': '[PKG]',
-        '🔍': '[FIND]',
-        '═': '='
-    }
-    
-    for emoji_char, replacement in emoji_map.items():
+    # Emojis de um codepoint numa única passada; os com seletor de variação à parte
+    content = _translate_emojis(content)
+    for emoji_char, replacement in _EMOJI_MULTI.items():
         content = content.replace(emoji_char, replacement)
     
-    file_path.write_text(content, encoding='utf-8')
-    print(f"✅ {file_path.name}: Emojis substituídos")
+    return content
 
 def main():
     """Executa todas as correções"""
@@ -67,14 +117,21 @@ def main():
         
         print(f"📝 Processando {file_name}...")
         
-        # Backup
+        # Backup (cópia direta dos bytes, sem decodificar)
         backup_path = file_path.with_suffix('.py.bak')
-        backup_path.write_text(file_path.read_text(encoding='utf-8'), encoding='utf-8')
+        shutil.copyfile(file_path, backup_path)
         print(f"💾 Backup criado: {backup_path.name}")
         
-        # Aplicar correções
-        fix_emoji_logging(file_path)
-        fix_query_get(file_path)
+        # Aplicar correções: uma leitura e uma escrita por arquivo
+        content = file_path.read_text(encoding='utf-8')
+        
+        content = fix_emoji_logging(content)
+        print(f"✅ {file_name}: Emojis substituídos")
+        
+        content = fix_query_get(content)
+        print(f"✅ {file_name}: Query.get() corrigido")
+        
+        file_path.write_text(content, encoding='utf-8')
         
         print(f"✅ {file_name} corrigido\n")
     
@@ -1,6 +1,5 @@
 import os
-import json
-import requests
+from tess_client import DEFAULT_TIMEOUT, dumps_pretty, get_session, loads
 
 # Carrega API Key do ambiente
 API_KEY = os.getenv("PARETO_API_KEY")
@@ -19,21 +18,16 @@ data = {
     "language": "Portuguese (Brazil)"
 }
 
-headers = {
-    "Authorization": f"Bearer {API_KEY}",
-    "Content-Type": "application/json"
-}
-
-# Envia requisição
-response = requests.post(URL, headers=headers, json=data)
+# Envia requisição (sessão compartilhada já autenticada)
+response = get_session(API_KEY).post(URL, json=data, timeout=DEFAULT_TIMEOUT)
 
 if response.status_code == 200:
     print("✅ REQUISIÇÃO ENVIADA COM SUCESSO!")
-    resp_json = response.json()
+    resp_json = loads(response.content)
     
     # Salva o último request_id
     with open("last_request.json", "w", encoding="utf-8") as f:
-        json.dump(resp_json, f, ensure_ascii=False, indent=2)
+        f.write(dumps_pretty(resp_json))
 else:
     print(f"❌ ERRO NA REQUISIÇÃO | STATUS CODE: {response.status_code}")
     print(response.text)
@@ -1,6 +1,6 @@
 import os
-import requests
 from dotenv import load_dotenv
+from tess_client import DEFAULT_TIMEOUT, get_session
 
 load_dotenv()
 
@@ -8,12 +8,7 @@ API_KEY = os.getenv("PARETO_API_KEY")
 
 url = "https://tess.pareto.io/api/agents"
 
-headers = {
-    "Authorization": f"Bearer {API_KEY}",
-    "Content-Type": "application/json"
-}
-
-response = requests.get(url, headers=headers)
+response = get_session(API_KEY).get(url, timeout=DEFAULT_TIMEOUT)
 
 print("STATUS:", response.status_code)
 print(response.json())
@@ -1,20 +1,21 @@
 from app import app, db
-from sqlalchemy import text
+from sqlalchemy import inspect, text
 
 def add_resume_text_column():
     """Adiciona a coluna resume_text se ela não existir"""
     with app.app_context():
         try:
-            # Tenta adicionar a coluna
-            with db.engine.connect() as conn:
-                conn.execute(text(
-                    "ALTER TABLE candidate ADD COLUMN IF NOT EXISTS resume_text TEXT"
-                ))
-                conn.commit()
+            # Consulta o catálogo antes do ALTER (funciona em SQLite, Postgres e MySQL)
+            with db.engine.begin() as conn:
+                columns = {column['name'] for column in inspect(conn).get_columns('candidate')}
+                if 'resume_text' in columns:
+                    print("✅ Coluna resume_text já existe")
+                    return
+                
+                conn.execute(text("ALTER TABLE candidate ADD COLUMN resume_text TEXT"))
             print("✅ Coluna resume_text adicionada com sucesso!")
         except Exception as e:
-            print(f"⚠️ Erro ao adicionar coluna (pode já existir): {e}")
+            print(f"⚠️ Erro ao adicionar coluna: {e}")
 
 if __name__ == "__main__":
     add_resume_text_column()
-    
\ No newline at end of file
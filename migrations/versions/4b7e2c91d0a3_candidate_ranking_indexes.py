@@ -0,0 +1,31 @@
+"""índices de ranking de candidatos
+
+Revision ID: 4b7e2c91d0a3
+Revises: 
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b7e2c91d0a3'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Bancos criados pelo db.create_all() do app.py já nascem com os índices
+    existing = {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('candidate')}
+    
+    if 'ix_candidate_job_score' not in existing:
+        op.create_index('ix_candidate_job_score', 'candidate', ['job_id', sa.text('ai_score DESC')])
+    if 'ix_candidate_status' not in existing:
+        op.create_index('ix_candidate_status', 'candidate', ['status'])
+
+
+def downgrade():
+    op.drop_index('ix_candidate_status', table_name='candidate')
+    op.drop_index('ix_candidate_job_score', table_name='candidate')
@@ -0,0 +1,27 @@
+"""amplia user.password_hash para 256 caracteres
+
+Revision ID: 5d739003a08c
+Revises: 4b7e2c91d0a3
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d739003a08c'
+down_revision = '4b7e2c91d0a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # batch: o SQLite não altera o tipo de coluna sem recriar a tabela
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.alter_column('password_hash', existing_type=sa.String(length=200), type_=sa.String(length=256))
+
+
+def downgrade():
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.alter_column('password_hash', existing_type=sa.String(length=256), type_=sa.String(length=200))
@@ -1,8 +1,9 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
 
+from utils.security import hash_password, verify_password
+
 db = SQLAlchemy()
 
 
@@ -13,7 +14,7 @@ class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(50), unique=True, nullable=False, index=True)
     email = db.Column(db.String(120), unique=True, nullable=False, index=True)
-    password_hash = db.Column(db.String(200), nullable=False)
+    password_hash = db.Column(db.String(256), nullable=False)
     is_admin = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     last_login = db.Column(db.DateTime)
@@ -21,14 +22,11 @@ class User(UserMixin, db.Model):
     # MÉTODOS DE SENHA CORRIGIDOS
     def set_password(self, password):
         """Criptografa e armazena a senha."""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = hash_password(password)
     
     def check_password(self, password):
         """Verifica se a senha fornecida corresponde ao hash armazenado."""
-        # A correção é garantir que este método exista e esteja correto.
-        # O código fornecido pelo usuário já estava correto, mas o erro
-        # ocorreu porque o banco de dados antigo não tinha o hash.
-        return check_password_hash(self.password_hash, password)
+        return verify_password(self.password_hash, password)
     
     def __repr__(self):
         return f'<User {self.username}>'
@@ -2,7 +2,6 @@
 # EXECUTE ESTE SCRIPT PARA RESETAR A SENHA DO USUÁRIO
 
 from app import app, db, User
-from werkzeug.security import generate_password_hash
 
 with app.app_context():
     # Buscar primeiro usuário
@@ -14,7 +13,7 @@ with app.app_context():
         
         # Gerar novo hash correto
         nova_senha = "admin123"  # ← MUDE AQUI PARA SUA SENHA
-        user.password_hash = generate_password_hash(nova_senha)
+        user.set_password(nova_senha)
         
         db.session.commit()
         
@@ -0,0 +1,53 @@
+"""
+Cliente HTTP compartilhado para a API Tess
+Uma única requests.Session (keep-alive + retries) reaproveitada pelos scripts
+"""
+
+import json
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Opcional: encode/decode JSON mais rápido
+    import orjson
+except ImportError:
+    orjson = None
+
+# Timeout padrão: (conexão, leitura) em segundos
+DEFAULT_TIMEOUT = (3, 30)
+
+# Retries em falha de conexão e em 502/503/504; POST só é repetido se a
+# requisição nem chegou ao servidor (execução de agente não é idempotente)
+_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY))
+
+
+def get_session(api_key: str = None) -> requests.Session:
+    """
+    Retorna a sessão compartilhada
+    (com api_key, define os headers de autenticação uma única vez)
+    """
+    if api_key:
+        _SESSION.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        })
+    return _SESSION
+
+
+def loads(data):
+    """Decodifica JSON (bytes ou str), com orjson quando disponível"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_pretty(obj) -> str:
+    """JSON indentado (2 espaços) e sem escapar acentos, para exibir/salvar"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
@@ -3,25 +3,18 @@ Teste rápido da API Tess
 """
 
 import os
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from tess_client import get_session
 
 load_dotenv()
 
 api_key = os.getenv('PARETO_API_KEY')
 agent_id = os.getenv('TESS_AGENT_ID', '67')
 endpoint = f"https://tess.pareto.io/api/agents/{agent_id}/execute"
-
-print(f"🔑 API Key: {api_key[:20]}...")
-print(f"🆔 Agent ID: {agent_id}")
-print(f"🔗 Endpoint: {endpoint}")
+agent_url = f"https://tess.pareto.io/api/agents/{agent_id}"
 
 # Teste simples
-headers = {
-    "Authorization": f"Bearer {api_key}",
-    "Content-Type": "application/json"
-}
-
 payload = {
     "input": "Olá, teste",
     "parameters": {
@@ -30,9 +23,37 @@ payload = {
     }
 }
 
-try:
-    response = requests.post(endpoint, json=payload, headers=headers, timeout=10)
-    print(f"\n📡 Status: {response.status_code}")
-    print(f"📄 Resposta: {response.text[:500]}")
-except Exception as e:
-    print(f"\n❌ Erro: {e}")
\ No newline at end of file
+
+# Script manual (chama a API real): as funções não usam o prefixo test_ para o pytest não coletá-las
+def check_tess_connection(session):
+    """Executa o agente com uma mensagem curta"""
+    try:
+        response = session.post(endpoint, json=payload, timeout=10)
+        return f"\n📡 Status: {response.status_code}\n📄 Resposta: {response.text[:500]}"
+    except Exception as e:
+        return f"\n❌ Erro: {e}"
+
+
+def check_agent_details(session):
+    """Busca os dados do agente configurado"""
+    try:
+        response = session.get(agent_url, timeout=10)
+        return f"\n🤖 Agente - Status: {response.status_code}\n📄 Detalhes: {response.text[:500]}"
+    except Exception as e:
+        return f"\n❌ Erro ao buscar agente: {e}"
+
+
+if __name__ == '__main__':
+    session = get_session(api_key)
+    
+    print(f"🔑 API Key: {api_key[:20]}...")
+    print(f"🆔 Agent ID: {agent_id}")
+    print(f"🔗 Endpoint: {endpoint}")
+    
+    # As duas requisições são independentes: rodam em paralelo na mesma sessão
+    # e os resultados são exibidos na ordem, depois que ambas terminam
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        probes = [executor.submit(check_tess_connection, session), executor.submit(check_agent_details, session)]
+    
+    for probe in probes:
+        print(probe.result())
@@ -1,7 +1,7 @@
 # teste.py
 import os
-import json
 import requests
+from tess_client import dumps_pretty, get_session, loads
 from dotenv import load_dotenv
 import certifi
 
@@ -43,31 +43,25 @@ payload = {
     "language": "Portuguese (Brazil)"
 }
 
-# ==============================
-# 🛡️ Headers
-# ==============================
-headers = {
-    "Authorization": f"Bearer {API_KEY}",
-    "Content-Type": "application/json"
-}
-
 # ==============================
 # 🔧 Requisição com sessão segura
 # ==============================
-with requests.Session() as s:
-    s.verify = certifi.where()  # Garante certificado SSL atualizado
-    try:
-        response = s.post(url, json=payload, headers=headers, timeout=30)
-        response.raise_for_status()  # Gera exceção para erros HTTP
-        data = response.json()
-        print("✅ Requisição enviada com sucesso!")
-        print("🔹 Resposta da Tess:\n")
-        # Exibe o output, se existir
-        if "output" in data:
-            print(data["output"])
-        else:
-            print(json.dumps(data, indent=2, ensure_ascii=False))
-    except requests.exceptions.SSLError as ssl_err:
-        print("❌ Erro SSL:", ssl_err)
-    except requests.exceptions.RequestException as req_err:
-        print("❌ Erro na requisição:", req_err)
+s = get_session(API_KEY)  # Sessão compartilhada: headers, keep-alive e retries
+s.verify = certifi.where()  # Garante certificado SSL atualizado
+try:
+    response = s.post(url, json=payload, timeout=30)
+    response.raise_for_status()  # Gera exceção para erros HTTP
+    data = loads(response.content)
+    print("✅ Requisição enviada com sucesso!")
+    print("🔹 Resposta da Tess:\n")
+    # Exibe o output, se existir
+    if "output" in data:
+        print(data["output"])
+    else:
+        print(dumps_pretty(data))
+except requests.exceptions.SSLError as ssl_err:
+    print("❌ Erro SSL:", ssl_err)
+except requests.exceptions.RequestException as req_err:
+    print("❌ Erro na requisição:", req_err)
+except ValueError as json_err:
+    print("❌ Resposta não é um JSON válido:", json_err)
@@ -0,0 +1,74 @@
+"""
+Regressão da extração de tecnologias do EnhancedCVAnalyzer
+Compara com a implementação original (uma busca por tecnologia)
+"""
+import random
+import re
+
+import pytest
+
+from enhanced_analyzer import EnhancedCVAnalyzer
+
+
+def _baseline_technologies(text):
+    """Extração original: re.search com word boundary para cada tecnologia"""
+    found = {}
+    for category, techs in EnhancedCVAnalyzer.TECH_STACK.items():
+        found[category] = sorted({
+            tech.title() for tech in techs
+            if re.search(r'\b' + re.escape(tech) + r'\b', text, re.IGNORECASE)
+        })
+    all_skills = sorted({skill for skills in found.values() for skill in skills})
+    return found, all_skills
+
+
+def _extract(analyzer, text):
+    result = analyzer._extract_all_technologies(text.lower())
+    by_category = {category: sorted(skills) for category, skills in result['by_category'].items()}
+    return by_category, sorted(result['all_skills'])
+
+
+def _random_texts(count, seed=0):
+    """
+    Textos com tecnologias e palavras soltas; tecnologias encadeadas pela palavra
+    em comum ('microsoft excel' + 'excel avançado') geram sobreposições
+    """
+    techs = [tech.split() for techs in EnhancedCVAnalyzer.TECH_STACK.values() for tech in techs]
+    by_first_word = {}
+    for words in techs:
+        by_first_word.setdefault(words[0], []).append(words)
+    fillers = [word for words in techs for word in words] + ['e', 'com', 'de', '.', ',']
+    
+    rng = random.Random(seed)
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(1, 20)):
+            chained = by_first_word.get(parts[-1]) if parts else None
+            if chained and rng.random() < 0.7:
+                parts += rng.choice(chained)[1:]
+            elif rng.random() < 0.5:
+                parts += rng.choice(techs)
+            else:
+                parts.append(rng.choice(fillers))
+        text = ' '.join(parts)
+        yield text.upper() if rng.random() < 0.3 else text
+
+
+@pytest.fixture(params=['regex', 'default'])
+def analyzer(request):
+    analyzer = EnhancedCVAnalyzer()
+    if request.param == 'regex':
+        # Força o caminho da regex em trie mesmo com hyperscan instalado
+        analyzer._hs_db = None
+    return analyzer
+
+
+def test_overlapping_technologies(analyzer):
+    text = 'experiência com microsoft excel avançado e power bi'
+    _, all_skills = _extract(analyzer, text)
+    assert all_skills == ['Excel Avançado', 'Microsoft Excel', 'Power Bi']
+
+
+def test_matches_baseline_extraction(analyzer):
+    for text in _random_texts(2000):
+        assert _extract(analyzer, text) == _baseline_technologies(text), text
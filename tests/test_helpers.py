@@ -0,0 +1,124 @@
+"""
+Regressão de utils.helpers: o caminho vetorizado do get_average (arrays NumPy) deve dar
+o mesmo resultado do laço escalar, e a paginação só estima o total de queries sem filtro
+(e só quando pedido com approximate=True)
+"""
+from decimal import Decimal
+import random
+
+import numpy as np
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+from utils import helpers
+
+
+def _same(a, b):
+    if a != a:  # NaN
+        return b != b
+    return a == pytest.approx(b)
+
+
+def _random_arrays(count, seed=0):
+    """Arrays float/int/bool/object com NaN, None e valores não numéricos"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        size = rng.randint(0, 2000)
+        floats = [rng.uniform(0, 100) for _ in range(size)]
+        if floats and rng.random() < 0.2:
+            floats[rng.randrange(size)] = float('nan')
+        yield np.array(floats, dtype=np.float64)
+        yield np.array([rng.randint(0, 100) for _ in range(size)], dtype=np.int64)
+        yield np.array([rng.random() < 0.5 for _ in range(size)], dtype=bool)
+        yield np.array([rng.choice([rng.uniform(0, 100), None]) for _ in range(size)], dtype=object)
+
+
+@pytest.fixture(params=['numpy', 'numba'])
+def mean_backend(request, monkeypatch):
+    if request.param == 'numpy':
+        monkeypatch.setattr(helpers, '_mean', None)
+    elif helpers._mean is None:
+        pytest.skip('numba não instalado')
+    return request.param
+
+
+@pytest.mark.parametrize('values', [
+    ['1'] * 1500,
+    ['abc'] * 1500,
+    [None] * 1500,
+    [Decimal('1.5')] * 1500,
+    [1, '1'] * 750,
+    [1.0, float('nan')] * 750,
+    [True, False] * 750,
+    [],
+])
+def test_vectorized_matches_scalar_edge_cases(mean_backend, values):
+    expected = helpers._get_average_scalar(values)
+    assert _same(helpers.get_average(values), expected)
+    assert _same(helpers.get_average(np.array(values, dtype=object)), expected)
+
+
+def test_vectorized_matches_scalar(mean_backend):
+    for arr in _random_arrays(50):
+        assert _same(helpers.get_average(arr), helpers._get_average_scalar(arr.tolist()))
+
+
+def test_non_numeric_arrays():
+    assert helpers.get_average(np.array(['1'] * 1500)) == 0.0
+    assert helpers.get_average(np.array([[1.0, 2.0], [3.0, 4.0]])) == pytest.approx(2.5)
+
+
+def test_is_unfiltered():
+    Base = declarative_base()
+
+    class Job(Base):
+        __tablename__ = 'job'
+        id = Column(Integer, primary_key=True)
+
+    class Candidate(Base):
+        __tablename__ = 'candidate'
+        id = Column(Integer, primary_key=True)
+        job_id = Column(Integer, ForeignKey('job.id'))
+
+    session = Session(create_engine('sqlite://'))
+    query = session.query(Candidate)
+
+    assert helpers._is_unfiltered(query)
+    assert helpers._is_unfiltered(query.order_by(Candidate.id.desc()))
+    assert not helpers._is_unfiltered(query.filter_by(job_id=1))
+    assert not helpers._is_unfiltered(query.join(Job))
+    assert not helpers._is_unfiltered(session.query(Candidate, Job))
+
+
+def test_paginate_query_estimates_only_when_asked(monkeypatch):
+    Base = declarative_base()
+
+    class Candidate(Base):
+        __tablename__ = 'candidate'
+        id = Column(Integer, primary_key=True)
+        job_id = Column(Integer)
+
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    session.add_all(Candidate(id=i, job_id=i % 2) for i in range(1, 46))
+    session.commit()
+
+    # Caminho do PostgreSQL (COUNT(*) OVER () roda também no SQLite)
+    monkeypatch.setattr(engine.dialect, 'name', 'postgresql')
+    estimates = []
+    monkeypatch.setattr(helpers, 'approx_count', lambda query: estimates.append(query) or 10 ** 6)
+    query = session.query(Candidate).order_by(Candidate.id)
+
+    items, pagination = helpers.paginate_query(query, 3)
+    assert [c.id for c in items] == [41, 42, 43, 44, 45]
+    assert (pagination['total'], pagination['approximate']) == (45, False)
+
+    _, pagination = helpers.paginate_query(query.filter_by(job_id=1), 1, approximate=True)
+    assert (pagination['total'], pagination['approximate']) == (23, False)
+    assert not estimates
+
+    _, pagination = helpers.paginate_query(query, 1, approximate=True)
+    assert (pagination['total'], pagination['approximate']) == (10 ** 6, True)
+    assert len(estimates) == 1
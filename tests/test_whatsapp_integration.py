@@ -0,0 +1,51 @@
+"""
+Regressão do format_phones_batch (cada item igual ao format_phone) e da regra única
+de dígitos de telefone (phone_digits) entre validação, exibição e WhatsApp
+"""
+import random
+
+import pandas as pd
+
+from utils.helpers import format_phone_display
+from utils.validators import format_phone_for_whatsapp, phone_digits, validate_phone
+from whatsapp_integration import format_phone, format_phones_batch
+
+
+def _random_phones(count, seed=0):
+    """Telefones com máscara, DDI, vazios, números e caracteres fora do ASCII"""
+    rng = random.Random(seed)
+    alphabet = '0123456789 ()-+\n²١x'
+    fixed = [None, '', 0, 0.0, float('nan'), 11999999999, '0', '55', '5511999999999', '\n', '١١٩', '(1١) 9999²-9999', '(11) 99999-9999']
+    for _ in range(count):
+        if rng.random() < 0.2:
+            yield rng.choice(fixed)
+        else:
+            yield ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 16)))
+
+
+def test_batch_matches_format_phone():
+    for seed in range(20):
+        phones = list(_random_phones(200, seed))
+        # Sem '\n' nos valores: caminho do translate único
+        for batch in (phones, [p for p in phones if '\n' not in str(p)]):
+            assert format_phones_batch(batch).tolist() == [format_phone(p) for p in batch]
+
+
+def test_batch_keeps_series_index():
+    phones = pd.Series(['(11) 99999-9999', 0, None], index=[10, 20, 30])
+    result = format_phones_batch(phones)
+    assert result.index.tolist() == [10, 20, 30]
+    assert result.tolist() == ['5511999999999', None, None]
+
+
+def test_phone_digits_rule_is_shared():
+    for phone in _random_phones(2000):
+        if not phone:
+            continue
+        digits = phone_digits(phone)
+        assert digits == ''.join(filter(str.isdigit, str(phone)))
+        assert format_phone(phone) == (digits if digits[:2] == '55' else '55' + digits)
+        assert validate_phone(phone) == (len(digits) in (10, 11))
+        if len(digits) == 11 and digits[:2] != '55':
+            assert format_phone_display(phone) == f"({digits[:2]}) {digits[2:7]}-{digits[7:]}"
+            assert format_phone_for_whatsapp(phone) == '55' + digits
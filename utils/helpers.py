@@ -2,15 +2,35 @@
 Funções auxiliares gerais para TalentScope AI
 CRIAR: utils/helpers.py
 """
-from datetime import datetime
+from datetime import date as date_type, datetime
 from flask import flash
+from sqlalchemy import Table, func
 import logging
 
+from utils.validators import phone_digits
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # Opcional: compila a redução numérica de get_average
+    from numba import njit
+except ImportError:
+    njit = None
+
 logger = logging.getLogger(__name__)
 
 
 # ==================== FORMATAÇÃO ====================
 
+# Máscara de telefone por quantidade de dígitos (celular / fixo)
+_PHONE_FMT = {
+    11: lambda c: f"({c[:2]}) {c[2:7]}-{c[7:]}",
+    10: lambda c: f"({c[:2]}) {c[2:6]}-{c[6:]}"
+}
+
 def format_date(date, format='%d/%m/%Y'):
     """Formata data para exibição"""
     if not date:
@@ -22,6 +42,10 @@ def format_date(date, format='%d/%m/%Y'):
         except:
             return date
     
+    # Formato padrão montado direto dos atributos, sem passar pelo strftime
+    if format == '%d/%m/%Y' and isinstance(date, date_type):
+        return f"{date.day:02d}/{date.month:02d}/{date.year}"
+    
     try:
         return date.strftime(format)
     except:
@@ -41,18 +65,14 @@ def format_phone_display(phone):
     if not phone:
         return ''
     
-    clean = ''.join(filter(str.isdigit, str(phone)))
+    clean = phone_digits(phone)
     
     # Remove DDI se tiver
     if clean.startswith('55') and len(clean) > 11:
         clean = clean[2:]
     
-    if len(clean) == 11:
-        return f"({clean[:2]}) {clean[2:7]}-{clean[7:]}"
-    elif len(clean) == 10:
-        return f"({clean[:2]}) {clean[2:6]}-{clean[6:]}"
-    
-    return phone
+    fmt = _PHONE_FMT.get(len(clean))
+    return fmt(clean) if fmt else phone
 
 
 def format_score(score, decimals=1):
@@ -148,10 +168,37 @@ def flash_info(message):
 
 # ==================== PAGINAÇÃO ====================
 
-def paginate_query(query, page, per_page=20):
+# Com paginate_query(..., approximate=True) no PostgreSQL, acima dessa estimativa
+# o total da paginação é o do planejador
+APPROX_COUNT_THRESHOLD = 100_000
+
+
+def approx_count(query):
+    """
+    Estima o número de linhas de uma query pelo planejador do PostgreSQL
+    (EXPLAIN sem ANALYZE: não executa a query nem varre a tabela)
+    """
+    connection = query.session.connection()
+    compiled = query.statement.compile(dialect=connection.dialect)
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar()
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _is_unfiltered(query):
+    """Query sobre uma única tabela, sem WHERE nem JOIN"""
+    statement = query.statement
+    froms = statement.get_final_froms()
+    return statement.whereclause is None and len(froms) == 1 and isinstance(froms[0], Table)
+
+
+def paginate_query(query, page, per_page=20, approximate=False):
     """
     Pagina uma query SQLAlchemy
     
+    approximate=True (PostgreSQL): para uma tabela inteira, sem filtro, acima de
+    APPROX_COUNT_THRESHOLD linhas o total vem da estimativa do planejador em vez de
+    COUNT(*). Só deve ser usado em queries sem GROUP BY, DISTINCT ou LIMIT
+    
     Returns:
         tuple: (items, pagination_info)
     """
@@ -165,8 +212,34 @@ def paginate_query(query, page, per_page=20):
     if page < 1:
         page = 1
     
-    total = query.count()
-    items = query.limit(per_page).offset((page - 1) * per_page).all()
+    offset = (page - 1) * per_page
+    dialect = query.session.get_bind().dialect.name
+    estimated = False
+    
+    if (
+        approximate
+        and dialect == 'postgresql'
+        and _is_unfiltered(query)
+        and (estimate := approx_count(query)) > APPROX_COUNT_THRESHOLD
+    ):
+        # Tabelas grandes sem filtro: COUNT(*) exato seria uma varredura completa
+        total = estimate
+        estimated = True
+        items = query.limit(per_page).offset(offset).all()
+    elif dialect == 'sqlite':
+        total = query.count()
+        items = query.limit(per_page).offset(offset).all()
+    else:
+        # Total junto das linhas (COUNT(*) OVER ()): uma ida ao banco em vez de duas
+        rows = query.add_columns(func.count().over().label('total_count')).limit(per_page).offset(offset).all()
+        items = [row[0] for row in rows]
+        if rows:
+            total = rows[0][-1]
+        elif page > 1:
+            # Página além do fim: sem linhas não há total, conta à parte
+            total = query.count()
+        else:
+            total = 0
     
     pagination = {
         'page': page,
@@ -176,7 +249,8 @@ def paginate_query(query, page, per_page=20):
         'has_prev': page > 1,
         'has_next': page * per_page < total,
         'prev_page': page - 1 if page > 1 else None,
-        'next_page': page + 1 if page * per_page < total else None
+        'next_page': page + 1 if page * per_page < total else None,
+        'approximate': estimated
     }
     
     return items, pagination
@@ -199,17 +273,20 @@ def is_safe_redirect_url(url):
     return True
 
 
+_SQL_CHARS = str.maketrans({'%': None, '_': None, ';': None})
+_SQL_SEQUENCES = ('--', '/*', '*/')
+
+
 def sanitize_search_query(query):
     """Remove caracteres perigosos de queries de busca"""
     if not query:
         return ''
     
-    # Remove caracteres especiais SQL
-    dangerous_chars = ['%', '_', ';', '--', '/*', '*/']
-    
-    clean_query = str(query)
-    for char in dangerous_chars:
-        clean_query = clean_query.replace(char, '')
+    # Remove caracteres especiais SQL: os simples numa passada só, depois as
+    # sequências, na mesma ordem (uma remoção pode formar a sequência seguinte)
+    clean_query = str(query).translate(_SQL_CHARS)
+    for sequence in _SQL_SEQUENCES:
+        clean_query = clean_query.replace(sequence, '')
     
     return clean_query.strip()
 
@@ -242,8 +319,20 @@ def calculate_percentage(part, total):
         return 0.0
 
 
-def get_average(values):
-    """Calcula média com segurança"""
+if njit is not None:
+    @njit(cache=True)
+    def _mean(arr):
+        """Média de um array float64 não vazio (NaN propaga, como no sum)"""
+        total = 0.0
+        for i in range(arr.shape[0]):
+            total += arr[i]
+        return total / arr.shape[0]
+else:
+    _mean = None
+
+
+def _get_average_scalar(values):
+    """get_average original: laço Python sobre os valores"""
     if not values:
         return 0.0
     
@@ -255,4 +344,29 @@ def get_average(values):
     try:
         return sum(valid_values) / len(valid_values)
     except:
-        return 0.0
\ No newline at end of file
+        return 0.0
+
+
+def _get_average_vectorized(values):
+    """
+    get_average para arrays NumPy, com o mesmo resultado do laço escalar: NaN propaga
+    e arrays não numéricos (strings, object com None/Decimal) usam o laço escalar
+    """
+    arr = values.ravel()
+    if arr.dtype.kind not in 'biuf':
+        return _get_average_scalar(arr.tolist())
+    if not arr.size:
+        return 0.0
+    
+    if _mean is not None:
+        return float(_mean(arr.astype(np.float64, copy=False)))
+    return float(arr.mean(dtype=np.float64))
+
+
+def get_average(values):
+    """Calcula média com segurança"""
+    # Listas ficam no laço escalar: convertê-las para array custa mais que o próprio sum
+    if np is not None and isinstance(values, np.ndarray):
+        return _get_average_vectorized(values)
+    
+    return _get_average_scalar(values)
\ No newline at end of file
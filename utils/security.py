@@ -0,0 +1,60 @@
+"""
+Hash e verificação de senhas para TalentScope AI
+"""
+from functools import lru_cache
+import hashlib
+import hmac
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+# Algoritmo de hash de senha com custo explícito (n:r:p), ajustável sem depender
+# do default da versão do Werkzeug
+PASSWORD_HASH_METHOD = 'scrypt:32768:8:1'
+
+
+def hash_password(password):
+    """Gera o hash da senha com o método fixado"""
+    return generate_password_hash(password, method=PASSWORD_HASH_METHOD)
+
+
+@lru_cache(maxsize=1024)
+def _parse_password_hash(pwhash):
+    """
+    Separa um hash do Werkzeug ('método$salt$digest') em (função de derivação, digest)
+    Retorna None para formatos não reconhecidos (que ficam com o check_password_hash)
+    
+    Memoizado pelo próprio hash: cada requisição carrega um User novo do banco,
+    então um cache por instância nunca seria reaproveitado
+    """
+    if not isinstance(pwhash, str) or pwhash.count('$') < 2:
+        return None
+    
+    method, salt, digest = pwhash.split('$', 2)
+    name, *args = method.split(':')
+    salt = salt.encode('utf-8')
+    
+    try:
+        if name == 'scrypt' and len(args) == 3:
+            n, r, p = map(int, args)
+            def derive(password):
+                return hashlib.scrypt(password, salt=salt, n=n, r=r, p=p, maxmem=132 * n * r * p)
+        elif name == 'pbkdf2' and len(args) == 2:
+            hash_name, iterations = args[0], int(args[1])
+            def derive(password):
+                return hashlib.pbkdf2_hmac(hash_name, password, salt, iterations)
+        else:
+            return None
+    except ValueError:
+        return None
+    
+    return derive, digest
+
+
+def verify_password(pwhash, password):
+    """Verifica a senha contra o hash armazenado (mesmo resultado do check_password_hash)"""
+    parsed = _parse_password_hash(pwhash)
+    if parsed is None:
+        return check_password_hash(pwhash, password)
+    
+    derive, digest = parsed
+    return hmac.compare_digest(derive(password.encode('utf-8')).hex(), digest)
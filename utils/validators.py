@@ -2,44 +2,127 @@
 Validadores e funções auxiliares para TalentScope AI
 COLE ESTE CÓDIGO EM: utils/validators.py
 """
+import multiprocessing
 import os
 import re
+import threading
+from datetime import datetime
+from flask import has_request_context, request
 from werkzeug.utils import secure_filename
 import logging
+from logging.handlers import BufferingHandler
+
+# pypdfium2 (C, já instalado como dependência do pdfplumber) é o caminho principal;
+# PyPDF2 fica como fallback
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
 
 logger = logging.getLogger(__name__)
 
 ALLOWED_EXTENSIONS = {'pdf'}
+_ALLOWED_SUFFIXES = tuple('.' + ext for ext in ALLOWED_EXTENSIONS)
+
+# Padrões pré-compilados
+# Domínio como sequência de rótulos sem ponto (label.)+tld: sem ambiguidade entre
+# as classes em volta do '.', e rótulos vazios ('a@b..com') são rejeitados
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9_.+%-]+@(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}$')
+EMAIL_MAX_LENGTH = 254
+
+# Bytes lidos do início do arquivo na checagem rápida de PDF
+PDF_PROBE_BYTES = 1024
+
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+
+# Validação de PDF com tempo máximo: roda num processo filho, que pode ser morto
+# se travar (uma thread travada seguraria o worker até o timeout do gunicorn).
+# fork: o filho já nasce com os módulos carregados, sem reimportar o app
+PDF_VALIDATION_TIMEOUT = 5
+_PDF_CONTEXT = multiprocessing.get_context(
+    'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+# Marca a thread que está criando o filho de validação; o fork copia essa thread,
+# então a marca também vale no filho (ver in_pdf_validation_child)
+_PDF_FORK = threading.local()
+
+# Máximo de registros de log que o filho guarda para o pai reemitir
+PDF_CHILD_LOG_CAPACITY = 100
+
+# PDFium não é thread-safe: acesso serializado entre threads do mesmo processo
+_PDFIUM_LOCK = threading.Lock()
+
+# Bytes que secure_filename descarta (tudo fora de [A-Za-z0-9_.-])
+_FILENAME_STRIP_BYTES = bytes(
+    c for c in range(256) if not (chr(c) in '_.-' or (c < 128 and chr(c).isalnum()))
+)
+
+# Bytes que não são dígitos ASCII (0-9), removidos com bytes.translate
+# (caminho rápido de phone_digits para texto ASCII)
+_NON_DIGIT_BYTES = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
 
 # ==================== VALIDAÇÃO DE ARQUIVOS ====================
 
 def allowed_file(filename):
     """Verifica se a extensão do arquivo é permitida"""
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
+
+
+def _fast_secure(filename):
+    """secure_filename sem normalização unicode para nomes ASCII (fora do Windows)"""
+    if not filename.isascii() or os.name == 'nt':
+        return secure_filename(filename)
+    
+    filename = '_'.join(filename.replace('/', ' ').split())
+    return filename.encode('ascii').translate(None, _FILENAME_STRIP_BYTES).decode('ascii').strip('._')
 
 
 def sanitize_filename(filename):
     """Sanitiza nome de arquivo e adiciona timestamp"""
-    from datetime import datetime
-    
-    filename = secure_filename(filename)
+    filename = _fast_secure(filename)
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     name, ext = os.path.splitext(filename)
-    name = re.sub(r'[^a-zA-Z0-9_-]', '_', name)
+    # Após secure_filename só resta '.' fora de [a-zA-Z0-9_-] no nome
+    name = name.replace('.', '_')
     
     return f"{name}_{timestamp}{ext}"
 
 
 def validate_file_size(file, max_size_mb=16):
     """Valida tamanho do arquivo"""
-    file.seek(0, os.SEEK_END)
-    size = file.tell()
-    file.seek(0)
-    
     max_bytes = max_size_mb * 1024 * 1024
+    size = getattr(file, 'content_length', None)
     
-    if size > max_bytes:
+    if not size:
+        # O corpo inteiro da requisição cabe no limite: basta saber se o arquivo tem conteúdo
+        total = request.content_length if has_request_context() else None
+        if total is not None and total <= max_bytes:
+            file.seek(0)
+            empty = not file.read(1)
+            file.seek(0)
+            return (False, "Arquivo está vazio") if empty else (True, "")
+        
+        file.seek(0, os.SEEK_END)
+        size = file.tell()
+        file.seek(0)
+    
+    return _check_size(size, max_size_mb)
+
+
+def validate_file_size_path(filepath, max_size_mb=16):
+    """Valida tamanho de um arquivo já salvo em disco (um único stat)"""
+    return _check_size(os.stat(filepath).st_size, max_size_mb)
+
+
+def _check_size(size, max_size_mb):
+    """Compara o tamanho em bytes com o limite em MB"""
+    if size > max_size_mb * 1024 * 1024:
         size_mb = size / (1024 * 1024)
         return False, f"Arquivo muito grande ({size_mb:.1f}MB). Máximo: {max_size_mb}MB"
     
@@ -49,19 +132,86 @@ def validate_file_size(file, max_size_mb=16):
     return True, ""
 
 
+def _check_pdf_header(filepath):
+    """
+    Checagem rápida: cabeçalho %PDF- no início do arquivo
+    (o %%EOF não é exigido: PDFs válidos podem ter bytes extras depois dele,
+    e arquivos truncados são pegos pela leitura completa)
+    """
+    with open(filepath, 'rb') as f:
+        head = f.read(PDF_PROBE_BYTES)
+    
+    if b'%PDF-' not in head:
+        return False, "Arquivo não é um PDF"
+    
+    return True, ""
+
+
+def _validate_pdf_pdfium(filepath):
+    """
+    Valida o PDF com pypdfium2
+    Retorna None se o PDFium não abrir o documento (ele também recusa PDFs sem páginas)
+    """
+    try:
+        pdf = pdfium.PdfDocument(filepath)
+    except Exception as e:
+        logger.debug(f"PDFium não abriu o PDF: {e}")
+        return None
+    
+    try:
+        if len(pdf) == 0:
+            return False, "PDF vazio (sem páginas)"
+        
+        # Carregar a página já interpreta sua estrutura; extrair texto não é necessário
+        try:
+            first_page = pdf[0]
+            first_page.get_size()
+            first_page.close()
+        except Exception as e:
+            return False, f"Erro ao ler PDF: {str(e)}"
+        
+        return True, ""
+    finally:
+        pdf.close()
+
+
 def validate_pdf_content(filepath):
     """Valida se o PDF é legível"""
     try:
-        import PyPDF2
+        valid, error = _check_pdf_header(filepath)
+    except OSError as e:
+        logger.error(f"Erro ao validar PDF: {e}")
+        return False, "Arquivo PDF inválido ou corrompido"
+    
+    if not valid:
+        return False, error
+    
+    if pdfium is not None:
+        with _PDFIUM_LOCK:
+            result = _validate_pdf_pdfium(filepath)
+        if result is not None:
+            return result
+        
+        # PDFium recusou o arquivo: o PyPDF2 distingue PDF sem páginas de corrompido
+        if PyPDF2 is None:
+            logger.error(f"Erro ao validar PDF: PDFium não abriu {filepath}")
+            return False, "Arquivo PDF inválido ou corrompido"
+    
+    if PyPDF2 is None:
+        logger.error("Erro ao validar PDF: nenhuma biblioteca de PDF instalada")
+        return False, "Arquivo PDF inválido ou corrompido"
+    
+    try:
         with open(filepath, 'rb') as f:
             reader = PyPDF2.PdfReader(f)
             
             if len(reader.pages) == 0:
                 return False, "PDF vazio (sem páginas)"
             
+            # Lê o stream de conteúdo sem decodificar glifos
             try:
                 first_page = reader.pages[0]
-                text = first_page.extract_text()
+                first_page.get_contents()
             except Exception as e:
                 return False, f"Erro ao ler PDF: {str(e)}"
         
@@ -72,15 +222,79 @@ def validate_pdf_content(filepath):
         return False, "Arquivo PDF inválido ou corrompido"
 
 
+def in_pdf_validation_child():
+    """True no processo filho da validação de PDF (e no pai, durante o fork)"""
+    return getattr(_PDF_FORK, 'active', False)
+
+
+def _validate_pdf_child(filepath, conn):
+    """
+    Executado no processo filho: envia o resultado de validate_pdf_content junto
+    com os logs gerados, que o pai reemite (o filho não tem listener de logs)
+    """
+    # O lock herdado pode ter sido copiado travado por outra thread do pai
+    global _PDFIUM_LOCK
+    _PDFIUM_LOCK = threading.Lock()
+    
+    collector = BufferingHandler(PDF_CHILD_LOG_CAPACITY)
+    logging.getLogger().handlers = [collector]
+    
+    result = validate_pdf_content(filepath)
+    records = [(r.name, r.levelno, r.getMessage()) for r in collector.buffer]
+    conn.send((result, records))
+    conn.close()
+
+
+def validate_pdf_content_timeout(filepath, timeout=PDF_VALIDATION_TIMEOUT):
+    """Valida o PDF num processo filho, que é morto após `timeout` segundos"""
+    receiver, sender = _PDF_CONTEXT.Pipe(duplex=False)
+    process = _PDF_CONTEXT.Process(target=_validate_pdf_child, args=(filepath, sender), daemon=True)
+    _PDF_FORK.active = True
+    try:
+        process.start()
+    finally:
+        _PDF_FORK.active = False
+    sender.close()
+    
+    try:
+        if receiver.poll(timeout):
+            result, records = receiver.recv()
+            for name, level, message in records:
+                logging.getLogger(name).log(level, message)
+            return result
+        
+        logger.warning(f"Validação de PDF excedeu {timeout}s: {filepath}")
+        return False, f"Tempo esgotado ao validar PDF (máximo {timeout}s)"
+    except EOFError:
+        # O filho morreu sem responder (ex: crash do PDFium num arquivo malformado)
+        logger.error(f"Erro ao validar PDF: processo de validação encerrou ({filepath})")
+        return False, "Arquivo PDF inválido ou corrompido"
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.kill()
+        process.join()
+
+
 # ==================== VALIDAÇÃO DE DADOS ====================
 
 def validate_email(email):
     """Valida formato de email"""
-    if not email:
+    if not email or len(email) > EMAIL_MAX_LENGTH:
         return False
     
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
+
+
+def phone_digits(phone):
+    """
+    Mantém apenas os dígitos do telefone (regra de str.isdigit)
+    Regra única para validação, exibição e links do WhatsApp
+    """
+    raw = str(phone)
+    if raw.isascii():
+        return raw.encode('ascii').translate(None, _NON_DIGIT_BYTES).decode('ascii')
+    return ''.join(filter(str.isdigit, raw))
 
 
 def validate_phone(phone):
@@ -88,7 +302,7 @@ def validate_phone(phone):
     if not phone:
         return False
     
-    clean = ''.join(filter(str.isdigit, str(phone)))
+    clean = phone_digits(phone)
     return len(clean) in [10, 11]
 
 
@@ -97,12 +311,18 @@ def format_phone_for_whatsapp(phone):
     if not phone:
         return None
     
-    clean = ''.join(filter(str.isdigit, str(phone)))
+    clean = phone_digits(phone)
+    n = len(clean)
+    
+    # Já tem DDI: precisa de DDI + DDD + número (12 ou 13 dígitos)
+    if clean[:2] == '55':
+        return clean if n >= 12 else None
     
-    if len(clean) <= 11 and not clean.startswith('55'):
-        clean = '55' + clean
+    # Sem DDI: DDD + número (10 ou 11 dígitos) recebe o 55
+    if n <= 11:
+        return '55' + clean if n >= 10 else None
     
-    return clean if len(clean) >= 12 else None
+    return clean
 
 
 def validate_username(username):
@@ -116,7 +336,7 @@ def validate_username(username):
     if len(username) > 50:
         return False, "Usuário deve ter no máximo 50 caracteres"
     
-    if not re.match(r'^[a-zA-Z0-9_]+$', username):
+    if not _USERNAME_RE.match(username):
         return False, "Usuário deve conter apenas letras, números e underscore"
     
     return True, ""
@@ -144,4 +364,8 @@ def truncate_text(text, max_length=100, suffix='...'):
     if len(text) <= max_length:
         return text
     
+    # Sufixo padrão: comprimento conhecido, sem recalcular len(suffix)
+    if suffix == '...':
+        return text[:max_length - 3] + '...'
+    
     return text[:max_length - len(suffix)] + suffix
\ No newline at end of file
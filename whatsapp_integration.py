@@ -2,6 +2,13 @@
 Integração WhatsApp via Link Direto (wa.me)
 Funciona em qualquer dispositivo - sem precisar de API!
 """
+from urllib.parse import quote_from_bytes
+
+from utils.validators import phone_digits
+
+# Bytes que não são dígitos ASCII (0-9), exceto '\n' (separador do processamento em lote)
+_NON_DIGIT_BYTES_KEEP_NL = bytes(c for c in range(256) if not (0x30 <= c <= 0x39 or c == 0x0A))
+
 
 def format_phone(phone):
     """
@@ -13,13 +20,35 @@ def format_phone(phone):
         return None
     
     # Remove tudo que não é número
-    clean = ''.join(filter(str.isdigit, str(phone)))
+    clean = phone_digits(phone)
     
     # Se não tem DDI (55), adiciona
-    if not clean.startswith('55'):
-        clean = '55' + clean
+    return clean if clean[:2] == '55' else '55' + clean
+
+
+def format_phones_batch(phones):
+    """
+    format_phone para uma lista/Series de telefones (mesmo resultado, item a item)
+    Retorna uma Series com None onde format_phone retornaria None
+    """
+    import pandas as pd
     
-    return clean
+    phones = pd.Series(phones, dtype=object)
+    present = [bool(p) for p in phones]
+    raw = [str(p) for p in phones]
+    
+    # Caso comum (ASCII, sem quebras de linha nos valores): um único translate sobre todos os telefones
+    text = '\n'.join(raw)
+    if not text.isascii() or text.count('\n') != len(raw) - 1:
+        digits = [phone_digits(p) for p in raw]
+    else:
+        digits = text.encode('ascii').translate(None, _NON_DIGIT_BYTES_KEEP_NL).decode('ascii').split('\n')
+    
+    clean = [
+        (d if d[:2] == '55' else '55' + d) if keep else None
+        for d, keep in zip(digits, present)
+    ]
+    return pd.Series(clean, index=phones.index, dtype=object)
 
 
 def get_whatsapp_link(phone, message=None):
@@ -42,42 +71,36 @@ def get_whatsapp_link(phone, message=None):
     
     if message:
         # URL encode da mensagem
-        from urllib.parse import quote
-        base_url += f"?text={quote(message)}"
+        base_url += f"?text={quote_from_bytes(message.encode('utf-8'))}"
     
     return base_url
 
 
-def get_interview_invitation_message(candidate_name, job_title, date, time, link=None):
-    """Mensagem de convite para entrevista"""
-    message = f"""🎯 *Convite para Entrevista*
+# ==================== TEMPLATES DE MENSAGEM ====================
+
+_INVITATION_HEAD = """🎯 *Convite para Entrevista*
 
-Olá *{candidate_name}*! 👋
+Olá *{name}*! 👋
 
-É com satisfação que informamos que você foi selecionado(a) para a próxima etapa do processo seletivo para a vaga de *{job_title}*.
+É com satisfação que informamos que você foi selecionado(a) para a próxima etapa do processo seletivo para a vaga de *{job}*.
 
 📅 *Data:* {date}
 🕐 *Horário:* {time}"""
-    
-    if link:
-        message += f"\n🔗 *Link:* {link}"
-    
-    message += """
+
+_INVITATION_TAIL = """
 
 Por favor, confirme sua presença.
 
 Estamos ansiosos para conhecê-lo(a)! 😊"""
-    
-    return message
 
+_INVITATION_TPL = _INVITATION_HEAD + _INVITATION_TAIL
+_INVITATION_LINK_TPL = _INVITATION_HEAD + "\n🔗 *Link:* {link}" + _INVITATION_TAIL
 
-def get_approval_message(candidate_name, job_title):
-    """Mensagem de aprovação"""
-    return f"""🎉 *PARABÉNS!* 🎉
+_APPROVAL_TPL = """🎉 *PARABÉNS!* 🎉
 
-Olá *{candidate_name}*!
+Olá *{name}*!
 
-É com enorme satisfação que informamos que você foi *APROVADO(A)* para a vaga de *{job_title}*! 🎊
+É com enorme satisfação que informamos que você foi *APROVADO(A)* para a vaga de *{job}*! 🎊
 
 Ficamos muito impressionados com seu perfil!
 
@@ -85,12 +108,9 @@ Em breve entraremos em contato para os próximos passos.
 
 Seja muito bem-vindo(a)! 🤝"""
 
+_REJECTION_TPL = """Olá *{name}*,
 
-def get_rejection_message(candidate_name, job_title):
-    """Mensagem de reprovação"""
-    return f"""Olá *{candidate_name}*,
-
-Agradecemos seu interesse na vaga de *{job_title}* e por ter dedicado seu tempo ao processo seletivo.
+Agradecemos seu interesse na vaga de *{job}* e por ter dedicado seu tempo ao processo seletivo.
 
 Após análise, optamos por seguir com outros candidatos neste momento.
 
@@ -98,10 +118,7 @@ Esta decisão não diminui suas qualificações. Encorajamos você a acompanhar
 
 Desejamos muito sucesso! 🌟"""
 
-
-def get_thank_you_message(candidate_name):
-    """Mensagem de agradecimento"""
-    return f"""Olá *{candidate_name}*! 👋
+_THANK_YOU_TPL = """Olá *{name}*! 👋
 
 Agradecemos sua participação no processo seletivo.
 
@@ -109,13 +126,38 @@ Em breve entraremos em contato com os próximos passos.
 
 Fique à vontade para tirar dúvidas! 😊"""
 
+_REMINDER_TPL = """⏰ *Lembrete de Entrevista*
 
-def get_reminder_message(candidate_name, hours):
-    """Lembrete de entrevista"""
-    return f"""⏰ *Lembrete de Entrevista*
-
-Olá *{candidate_name}*!
+Olá *{name}*!
 
 Sua entrevista está marcada para daqui a *{hours} hora(s)*.
 
-Nos vemos em breve! 🤝"""
\ No newline at end of file
+Nos vemos em breve! 🤝"""
+
+
+def get_interview_invitation_message(candidate_name, job_title, date, time, link=None):
+    """Mensagem de convite para entrevista"""
+    if link:
+        return _INVITATION_LINK_TPL.format(name=candidate_name, job=job_title, date=date, time=time, link=link)
+    
+    return _INVITATION_TPL.format(name=candidate_name, job=job_title, date=date, time=time)
+
+
+def get_approval_message(candidate_name, job_title):
+    """Mensagem de aprovação"""
+    return _APPROVAL_TPL.format(name=candidate_name, job=job_title)
+
+
+def get_rejection_message(candidate_name, job_title):
+    """Mensagem de reprovação"""
+    return _REJECTION_TPL.format(name=candidate_name, job=job_title)
+
+
+def get_thank_you_message(candidate_name):
+    """Mensagem de agradecimento"""
+    return _THANK_YOU_TPL.format(name=candidate_name)
+
+
+def get_reminder_message(candidate_name, hours):
+    """Lembrete de entrevista"""
+    return _REMINDER_TPL.format(name=candidate_name, hours=hours)
\ No newline at end of file